@@ -0,0 +1,46 @@
+"""Settings shared by the the-odds-api scripts.
+
+The .env file is read once here and the scripts import the resulting
+values instead of each repeating the dotenv/os.getenv boilerplate.
+"""
+import os
+
+import httpx
+import orjson
+import zstandard as zstd
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv()
+
+# API key
+API_KEY = os.getenv("API_KEY")
+
+if API_KEY is None:
+    raise ValueError("API_KEY not found in .env file")
+
+# Base URL for the sports endpoints of the API
+BASE_URL = "https://api.the-odds-api.com/v4/sports"
+
+# Connection limits for the scripts' HTTP/2 clients
+HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+
+# Saved responses repeat the same team/bookmaker keys, so they compress well
+_compressor = zstd.ZstdCompressor(level=3)
+
+
+def save_json(file_path, data):
+    """Write `data` to `file_path` as zstd-compressed JSON.
+
+    Read it back with orjson.loads(zstd.ZstdDecompressor().decompress(...)).
+    """
+    with open(file_path, "wb") as json_file:
+        json_file.write(_compressor.compress(orjson.dumps(data)))
+
+
+def http_client(client_class=httpx.Client):
+    """Return an HTTP/2 client (httpx.Client or httpx.AsyncClient) for the API.
+
+    With the brotli extra installed, httpx accepts br as well as gzip.
+    """
+    return client_class(http2=True, limits=HTTP_LIMITS, timeout=10.0)
@@ -1,23 +1,10 @@
-import os
-import requests
-import json
-from dotenv import load_dotenv
+import asyncio
+import httpx
 
-# Load environment variables from .env file
-load_dotenv()
-
-# Base URL for the API
-base_url = "https://api.the-odds-api.com"
-endpoint = "/v4/sports/"
-
-# API key
-api_key = os.getenv("API_KEY")
-
-if api_key is None:
-    raise ValueError("API_KEY not found in .env file")
+import cache
+from _common import API_KEY, BASE_URL, http_client, save_json
 
 # Parameters for the request
-apiKey = api_key
 regions = "us"  # Or any other valid region, comma delimited if multiple
 markets = "outrights,spreads"  # Update with the specific market(s) you want odds for
 oddsFormat = "american"  # Specifies the format of odds in the response
@@ -26,33 +13,57 @@ sports = ['basketball_nba_championship_winner', 'americanfootball_nfl_super_bowl
           'americanfootball_ncaaf_championship_winner','baseball_mlb_world_series_winner',
           'basketball_ncaab_championship_winner','soccer_uefa_europa_conference_league']
 
-# List to store all odds data
-all_odds_data = []
+# Only the sport varies between requests, so the rest of the URL is built once
+url_tmpl = f"{BASE_URL}/{{sport}}/odds/?apiKey={API_KEY}&regions={regions}&markets={markets}&oddsFormat={oddsFormat}"
+
 
-# Loop through each sport
-for sport in sports:
+async def fetch(client, sport):
+    """Fetch the odds for a single sport, returning None on a non-200 response."""
     # Construct the full URL for the sport
-    url = f"{base_url}{endpoint}{sport}/odds/?apiKey={apiKey}&regions={regions}&markets={markets}&oddsFormat={oddsFormat}"
-    
+    url = url_tmpl.format(sport=sport)
+
     # Making the GET request
-    response = requests.get(url)
+    response = await client.get(url)
 
     # Check if the request was successful (status code 200)
     if response.status_code == 200:
         # Parse the JSON response
-        data = response.json()
-        
-        # Append the odds data for this sport to the list
-        all_odds_data.append(data)
-        
         print(f"Odds data for {sport} retrieved and added to the list.")
-    else:
-        print("Error:", response.status_code)
-        print(response.text)
-
-# Save all odds data to a combined JSON file
-all_odds_file_path = "all_odds_data.json"
-with open(all_odds_file_path, "w") as json_file:
-    json.dump(all_odds_data, json_file, indent=4)
-    
-print("All odds data saved to:", all_odds_file_path)
+        return response.json()
+
+    print("Error:", response.status_code)
+    print(response.text)
+    return None
+
+
+async def main():
+    # Reuse today's responses for sports fetched recently. The cache is blocking
+    # SQLite, so it is read before and written after the concurrent fetches.
+    cache_keys = {sport: cache.make_key(sport, markets, regions) for sport in sports}
+    results = {sport: cache.get(cache_keys[sport]) for sport in sports}
+    for sport, data in results.items():
+        if data is not None:
+            print(f"Odds data for {sport} loaded from cache.")
+    missing = [sport for sport, data in results.items() if data is None]
+
+    # Fetch every remaining sport concurrently; HTTP/2 multiplexes them over one connection
+    async with http_client(httpx.AsyncClient) as client:
+        fetched = await asyncio.gather(*[fetch(client, sport) for sport in missing])
+
+    for sport, data in zip(missing, fetched):
+        if data is not None:
+            cache.put(cache_keys[sport], data)
+            results[sport] = data
+
+    # List to store all odds data, in the same order as `sports`
+    all_odds_data = [results[sport] for sport in sports if results[sport] is not None]
+
+    # Save all odds data to a combined JSON file
+    all_odds_file_path = "all_odds_data.json.zst"
+    save_json(all_odds_file_path, all_odds_data)
+
+    print("All odds data saved to:", all_odds_file_path)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
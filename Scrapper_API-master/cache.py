@@ -0,0 +1,58 @@
+"""On-disk SQLite cache for the-odds-api responses.
+
+Each response is stored zstd-compressed under a SHA-1 key built from the
+request parameters plus the current UTC day, so reruns on the same day reuse
+the stored body instead of spending API quota on identical requests.
+"""
+import hashlib
+import sqlite3
+import time
+from contextlib import closing
+from datetime import datetime, timezone
+
+import orjson
+import zstandard as zstd
+
+# SQLite file holding the cached responses, created next to the scripts' output
+CACHE_PATH = "odds_cache.db"
+
+# How long (in seconds) a cached response is considered fresh
+DEFAULT_TTL = 3600
+
+_compressor = zstd.ZstdCompressor(level=3)
+_decompressor = zstd.ZstdDecompressor()
+
+
+def _connect():
+    conn = sqlite3.connect(CACHE_PATH)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, fetched_at INTEGER, body BLOB)"
+    )
+    return conn
+
+
+def make_key(*parts):
+    """Build a cache key from the request parameters and today's UTC date."""
+    day = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    raw = "|".join([*map(str, parts), day])
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def get(key, ttl=DEFAULT_TTL):
+    """Return the cached JSON data for `key`, or None if missing or stale."""
+    with closing(_connect()) as conn:
+        row = conn.execute("SELECT fetched_at, body FROM cache WHERE key = ?", (key,)).fetchone()
+
+    if row is None or row[0] <= time.time() - ttl:
+        return None
+    return orjson.loads(_decompressor.decompress(row[1]))
+
+
+def put(key, data):
+    """Store JSON-serializable `data` under `key`."""
+    body = _compressor.compress(orjson.dumps(data))
+    with closing(_connect()) as conn, conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO cache (key, fetched_at, body) VALUES (?, ?, ?)",
+            (key, int(time.time()), body),
+        )
@@ -1,44 +1,36 @@
-import os
-import requests
-import json
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
-
-# Base URL for the API
-base_url = "https://api.the-odds-api.com"
-endpoint = "/v4/sports"
-
-# API key
-api_key = os.getenv("API_KEY")
-
-if api_key is None:
-    raise ValueError("API_KEY not found in .env file")
-
-# Parameters for the request
-apiKey = api_key
-
-# Construct the full URL
-url = f"{base_url}{endpoint}?apiKey={apiKey}"
-
-# Print the URL
-print("Constructed URL:", url)
-
-# Making the GET request
-response = requests.get(url)
-
-# Check if the request was successful (status code 200)
-if response.status_code == 200:
-    # Parse the JSON response
-    data = response.json()
-    
-    # Save the data to a JSON file
-    file_path = "events_data.json"
-    with open(file_path, "w") as json_file:
-        json.dump(data, json_file, indent=4)
-        
-    print("Sports data saved to:", file_path)
-else:
-    print("Error:", response.status_code)
-    print(response.text)
+import cache
+from _common import API_KEY, BASE_URL, http_client, save_json
+
+if __name__ == "__main__":
+    # Construct the full URL
+    url = f"{BASE_URL}?apiKey={API_KEY}"
+
+    # Print the URL
+    print("Constructed URL:", url)
+
+    # Reuse today's response if it was fetched recently
+    cache_key = cache.make_key(BASE_URL)
+    data = cache.get(cache_key)
+
+    if data is None:
+        # Making the GET request over HTTP/2
+        with http_client() as client:
+            response = client.get(url)
+
+        # Check if the request was successful (status code 200)
+        if response.status_code == 200:
+            # Parse the JSON response
+            data = response.json()
+            cache.put(cache_key, data)
+        else:
+            print("Error:", response.status_code)
+            print(response.text)
+    else:
+        print("Sports data loaded from cache.")
+
+    if data is not None:
+        # Save the data to a JSON file
+        file_path = "events_data.json.zst"
+        save_json(file_path, data)
+
+        print("Sports data saved to:", file_path)
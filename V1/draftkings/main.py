@@ -7,51 +7,161 @@ Designed for Windows Server 2012 compatibility.
 
 Endpoints:
     POST /api/scrape: Trigger scraping and submission to CLM API
+    POST /api/scrape/background: Start a scrape and return immediately
+    GET /api/jobs/{job_id}: Poll a background scrape's status
+    GET /api/jobs/{job_id}/events: Stream a background scrape's progress
     GET /api/status: Get server status and configuration
     GET /api/games: List recent games created
+    GET /api/games/archive: List games logged more than a day ago
 """
 
 =======
 >>>>>>> 0967c96d35ccf3ba31b1ed299fb51952f4f64c4c
-import json
+import atexit
 import logging
+import queue
 import sqlite3
-from contextlib import closing
+import time
+from contextlib import asynccontextmanager, closing
+from logging.handlers import QueueHandler, QueueListener
 <<<<<<< HEAD
+import asyncio
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
+from cachetools import TTLCache
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse, StreamingResponse
 =======
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+from typing import Annotated, AsyncIterator, Dict, List, Optional, Tuple
+
+from cachetools import TTLCache
 from fastapi import FastAPI
+from fastapi.responses import Response
+from pydantic import AfterValidator
+import zstandard as zstd
 >>>>>>> 0967c96d35ccf3ba31b1ed299fb51952f4f64c4c
+import orjson
 from pydantic import BaseModel
 
 # Import the scraper functions
-from .scrapper import run_scraper, CONFIG, GameData, GameValuesTNT
+from .scrapper import (
+    run_scraper, scrape_odds, create_game, submit_game_odds, shutdown_drivers,
+    CONFIG, CONFIG_ROWS, SPORT_KEYS, SPORTS_BY_NAME, TOURNAMENTS, TOURNAMENTS_BY_NAME,
+    API_SESSION, DK_SESSION, DRIVER_POOL, GameData, GameValuesTNT, RunTimestamps, run_timestamps
+)
 
 <<<<<<< HEAD
-app = FastAPI(title="DraftKings Odds Scraper API", version="2.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Start the scraping-log tasks and size the driver pool; on shutdown, flush
+    the logs, then quit the drivers and close the HTTP sessions."""
+    await start_log_writer()
+    size_driver_pool()
+    yield
+    await stop_log_writer()
+    close_driver_pool()
+    close_http_sessions()
+
+app = FastAPI(title="DraftKings Odds Scraper API", version="2.0.0", default_response_class=ORJSONResponse, lifespan=lifespan)
+
+# Scraping and CLM API calls block for seconds, so they run off the event loop.
+# Browser fallbacks wait on DRIVER_POOL for a free Chrome instance.
+# Caps how many tournaments are scraped at once, to go easy on DraftKings
+SCRAPE_CONCURRENCY = int(os.getenv("SCRAPE_CONCURRENCY", "8"))
+_scrape_executor = ThreadPoolExecutor(max_workers=SCRAPE_CONCURRENCY, thread_name_prefix="scrape")
+_scrape_semaphore = asyncio.Semaphore(SCRAPE_CONCURRENCY)
+
+# DraftKings futures boards change every few minutes at most, so repeat
+# /api/scrape calls skip a tournament submitted moments ago instead of
+# scraping it again and creating a duplicate CLM game.
+# (sport, tournament) -> (game ID, teams submitted)
+SCRAPE_CACHE_TTL = 90
+_scrape_cache = TTLCache(maxsize=64, ttl=SCRAPE_CACHE_TTL)
 =======
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s — %(message)s")
 logger = logging.getLogger("odds_api")
 
-# Initialize SQLite connection and schema
-conn = sqlite3.connect("odds.db", check_same_thread=False)
-with closing(conn.cursor()) as cur:
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS odds (
-            provider TEXT,
-            sport TEXT,
-            tournament TEXT,
-            data TEXT,
-            PRIMARY KEY(provider, sport, tournament)
+# Initialize SQLite connection and schema; kept apart from the logging `conn`.
+# Under `uvicorn --workers N` each worker process imports this module, so
+# every worker gets its own writer and reader connections to odds.db.
+ODDS_DB_PATH = "odds.db"
+odds_conn = sqlite3.connect(ODDS_DB_PATH, check_same_thread=False, cached_statements=256)
+# Same tuning as the logging database, plus memory-mapped reads of the odds pages
+for pragma in ("journal_mode=WAL", "synchronous=NORMAL", "temp_store=MEMORY", "cache_size=-64000", "mmap_size=268435456"):
+    odds_conn.execute(f"PRAGMA {pragma}")
+# WITHOUT ROWID stores each payload in the primary key B-tree itself, so a GET
+# is a single index descent. Payloads are zstd-compressed JSON; their repeated
+# team names and keys shrink several times over, so far more rows fit in the
+# page cache. event_type is kept beside them so typed reads can check it
+# without decompressing anything.
+ODDS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS {name} (
+        provider TEXT,
+        sport TEXT,
+        tournament TEXT,
+        event_type TEXT,
+        data BLOB,
+        PRIMARY KEY(provider, sport, tournament)
+    ) WITHOUT ROWID
+"""
+# Bumped whenever ODDS_TABLE_SQL changes in a way older databases must be rebuilt for
+ODDS_SCHEMA_VERSION = 1
+# Only the odds-db thread compresses, so one compressor is enough
+_odds_compressor = zstd.ZstdCompressor(level=3)
+with closing(odds_conn.cursor()) as cur:
+    # Each uvicorn worker runs this on import; holding the write lock makes the
+    # others wait out the first one's rebuild and then find the schema current
+    cur.execute("BEGIN IMMEDIATE")
+    (schema_version,) = cur.execute("PRAGMA user_version").fetchone()
+    legacy = schema_version < ODDS_SCHEMA_VERSION and cur.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='odds'"
+    ).fetchone()
+    cur.execute(ODDS_TABLE_SQL.format(name="odds_new" if legacy else "odds"))
+    if legacy:
+        # Earlier layouts stored plain JSON text; copy it over compressed
+        rows = cur.execute(
+            "SELECT provider, sport, tournament, json_extract(data, '$.event_type'), data FROM odds"
+        ).fetchall()
+        cur.executemany(
+            "INSERT INTO odds_new (provider, sport, tournament, event_type, data) VALUES (?, ?, ?, ?, ?)",
+            [(*row[:4], _odds_compressor.compress(row[4].encode())) for row in rows],
         )
-        """
-    )
-    conn.commit()
+        cur.execute("DROP TABLE odds")
+        cur.execute("ALTER TABLE odds_new RENAME TO odds")
+    cur.execute(f"PRAGMA user_version={ODDS_SCHEMA_VERSION}")
+    odds_conn.commit()
+# Odds endpoints are async, so their SQLite calls run on this thread instead
+# of blocking the event loop; one thread also serializes use of odds_conn
+_odds_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="odds-db")
+# GETs use their own read-only connections; under WAL they read concurrently
+# and never queue behind the writer's commits
+_odds_read_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="odds-reader")
+_odds_readers = threading.local()
+
+def _odds_read_conn() -> sqlite3.Connection:
+    """Return this thread's read-only connection to the odds database."""
+    reader = getattr(_odds_readers, "conn", None)
+    if reader is None:
+        reader = _odds_readers.conn = sqlite3.connect(f"file:{ODDS_DB_PATH}?mode=ro", uri=True)
+        reader.execute("PRAGMA mmap_size=268435456")
+    return reader
+
+def _odds_decompressor() -> zstd.ZstdDecompressor:
+    """Return this thread's zstd decompressor; instances are not thread-safe."""
+    dctx = getattr(_odds_readers, "dctx", None)
+    if dctx is None:
+        dctx = _odds_readers.dctx = zstd.ZstdDecompressor()
+    return dctx
 
 class TeamOdds(BaseModel):
     team: str
@@ -62,14 +172,65 @@ class TeamOdds(BaseModel):
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s — %(message)s")
 logger = logging.getLogger("odds_api")
 
-# Initialize SQLite connection for logging
-conn = sqlite3.connect("odds_scraper.db", check_same_thread=False)
+class _DeferredQueueHandler(QueueHandler):
+    """Queue records as-is, leaving message formatting to the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+# Request handlers only enqueue odds_api records; formatting and writing to
+# stderr happen on the listener thread. It is stopped at interpreter exit
+# rather than on app shutdown, so records logged by shutdown handlers still
+# get written.
+_log_records: queue.Queue = queue.Queue(-1)
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s — %(message)s"))
+_log_listener = QueueListener(_log_records, _log_stream_handler)
+logger.addHandler(_DeferredQueueHandler(_log_records))
+logger.propagate = False
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# Initialize SQLite connection for logging; only the log writer thread uses it
+LOG_DB_PATH = "odds_scraper.db"
+conn = sqlite3.connect(LOG_DB_PATH, check_same_thread=False, cached_statements=256)
+# WAL with synchronous=NORMAL skips the per-commit fsync of the rollback journal
+conn.execute("PRAGMA journal_mode=WAL")
+conn.execute("PRAGMA synchronous=NORMAL")
+conn.execute("PRAGMA temp_store=MEMORY")
+# 64 MB page cache (negative values are KiB) keeps the log table hot for /api/games
+conn.execute("PRAGMA cache_size=-64000")
+
+def _add_timestamp_ms(cur: sqlite3.Cursor, table: str):
+    """Give a log table created with ISO text timestamps an epoch-ms column."""
+    columns = {row[1] for row in cur.execute(f"PRAGMA table_info({table})")}
+    if "timestamp_ms" in columns:
+        return
+    cur.execute(f"ALTER TABLE {table} ADD COLUMN timestamp_ms INTEGER")
+    cur.execute(f"UPDATE {table} SET timestamp_ms = CAST(ROUND((julianday(timestamp) - 2440587.5) * 86400000) AS INTEGER)")
+
 with closing(conn.cursor()) as cur:
+    # Rows are stamped with integer epoch milliseconds; they are only
+    # formatted as ISO strings for the few rows an endpoint returns
     cur.execute(
         """
         CREATE TABLE IF NOT EXISTS scraping_logs (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
-            timestamp TEXT,
+            timestamp_ms INTEGER,
+            sport TEXT,
+            tournament TEXT,
+            game_id INTEGER,
+            status TEXT,
+            message TEXT
+        )
+        """
+    )
+    # Rows older than LOG_RETENTION_MS are moved here, keeping scraping_logs small
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS scraping_logs_archive (
+            id INTEGER PRIMARY KEY,
+            timestamp_ms INTEGER,
             sport TEXT,
             tournament TEXT,
             game_id INTEGER,
@@ -78,8 +239,29 @@ with closing(conn.cursor()) as cur:
         )
         """
     )
+    _add_timestamp_ms(cur, "scraping_logs")
+    _add_timestamp_ms(cur, "scraping_logs_archive")
+    # /api/games reads the newest rows; the index makes that a short range scan
+    cur.execute("DROP INDEX IF EXISTS idx_scraping_logs_timestamp")
+    cur.execute("DROP INDEX IF EXISTS idx_scraping_logs_archive_timestamp")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_scraping_logs_timestamp_ms ON scraping_logs (timestamp_ms DESC)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_scraping_logs_archive_timestamp_ms ON scraping_logs_archive (timestamp_ms DESC)")
     conn.commit()
 
+# With WAL, readers on their own connections never wait for the log writer.
+# Each reader thread lazily opens one read-only connection and keeps it.
+_read_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="log-reader")
+_readers = threading.local()
+
+def _read_conn() -> sqlite3.Connection:
+    """Return this thread's read-only connection to the log database."""
+    reader = getattr(_readers, "conn", None)
+    if reader is None:
+        reader = _readers.conn = sqlite3.connect(f"file:{LOG_DB_PATH}?mode=ro", uri=True)
+        # Rows map column names to values, matching the GameLog fields
+        reader.row_factory = sqlite3.Row
+    return reader
+
 class ScrapeRequest(BaseModel):
     sport: Optional[str] = None
     tournament: Optional[str] = None
@@ -99,108 +281,389 @@ class GameLog(BaseModel):
     status: str
     message: str
 
+# Log rows are queued by request handlers and written by scraping_log_writer,
+# so SQLite inserts and commits never block the event loop
+LOG_BATCH_SIZE = 128
+# How long the writer lets rows accumulate after the first one arrives
+LOG_FLUSH_INTERVAL = 0.5
+_log_queue: "asyncio.Queue[Tuple]" = asyncio.Queue()
+# A single thread keeps writes to the shared connection serialized
+_log_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-writer")
+_log_writer: Optional[asyncio.Task] = None
+
+# scraping_logs keeps the last day of rows; older ones go to scraping_logs_archive
+LOG_RETENTION_MS = 24 * 60 * 60 * 1000
+LOG_ARCHIVE_INTERVAL = 3600
+_log_archiver: Optional[asyncio.Task] = None
+
+# Checkpointing on a schedule keeps the WAL file short, so no log write ever
+# stalls on a large automatic checkpoint
+WAL_CHECKPOINT_INTERVAL = 300
+_wal_checkpointer: Optional[asyncio.Task] = None
+
 def log_scraping_activity(sport: str, tournament: str, game_id: Optional[int], status: str, message: str):
-    """Log scraping activity to the database."""
-    timestamp = datetime.utcnow().isoformat()
-    with closing(conn.cursor()) as cur:
+    """Queue a scraping activity row for the background log writer."""
+    _log_queue.put_nowait((time.time_ns() // 1_000_000, sport, tournament, game_id, status, message))
+
+# One shared string, so every batch reuses the connection's prepared statement
+INSERT_LOG_SQL = "INSERT INTO scraping_logs (timestamp_ms, sport, tournament, game_id, status, message) VALUES (?, ?, ?, ?, ?, ?)"
+
+def write_scraping_logs(rows: List[Tuple]):
+    """Write a batch of scraping activity rows in one transaction.
+    
+    The connection context commits once for the whole batch, or rolls it back
+    so a failed insert never leaves a half-written transaction open.
+    """
+    with conn, closing(conn.cursor()) as cur:
+        cur.executemany(INSERT_LOG_SQL, rows)
+
+def archive_scraping_logs() -> int:
+    """Move log rows older than LOG_RETENTION_MS to the archive in one transaction.
+    
+    Returns:
+        Number of rows archived
+    """
+    cutoff = time.time_ns() // 1_000_000 - LOG_RETENTION_MS
+    with conn, closing(conn.cursor()) as cur:
         cur.execute(
-            "INSERT INTO scraping_logs (timestamp, sport, tournament, game_id, status, message) VALUES (?, ?, ?, ?, ?, ?)",
-            (timestamp, sport, tournament, game_id, status, message)
+            "INSERT INTO scraping_logs_archive (id, timestamp_ms, sport, tournament, game_id, status, message) "
+            "SELECT id, timestamp_ms, sport, tournament, game_id, status, message FROM scraping_logs WHERE timestamp_ms < ?",
+            (cutoff,)
         )
-        conn.commit()
+        cur.execute("DELETE FROM scraping_logs WHERE timestamp_ms < ?", (cutoff,))
+        return cur.rowcount
+
+async def scraping_log_archiver():
+    """Archive old log rows at startup and every LOG_ARCHIVE_INTERVAL seconds."""
+    loop = asyncio.get_running_loop()
+    while True:
+        try:
+            # Same thread as the log writer, so the two never contend for the connection
+            archived = await loop.run_in_executor(_log_executor, archive_scraping_logs)
+            if archived:
+                logger.info("Archived %d scraping log rows", archived)
+        except Exception as exc:
+            logger.exception("Failed to archive scraping logs: %s", exc)
+        await asyncio.sleep(LOG_ARCHIVE_INTERVAL)
+
+def checkpoint_log_db():
+    """Copy the WAL into the database file and truncate it."""
+    busy, wal_pages, checkpointed = conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+    if busy:
+        logger.warning("WAL checkpoint blocked by readers; %d of %d pages copied", checkpointed, wal_pages)
+
+async def wal_checkpointer():
+    """Checkpoint the log database every WAL_CHECKPOINT_INTERVAL seconds."""
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(WAL_CHECKPOINT_INTERVAL)
+        try:
+            await loop.run_in_executor(_log_executor, checkpoint_log_db)
+        except Exception as exc:
+            logger.exception("WAL checkpoint failed: %s", exc)
+
+async def scraping_log_writer():
+    """Write queued log rows in batches of up to LOG_BATCH_SIZE.
+    
+    Scrapes log one row at a time as tournaments finish, so after the first
+    row the writer waits up to LOG_FLUSH_INTERVAL for more before committing.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        rows = [await _log_queue.get()]
+        deadline = loop.time() + LOG_FLUSH_INTERVAL
+        while len(rows) < LOG_BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                rows.append(await asyncio.wait_for(_log_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        try:
+            await loop.run_in_executor(_log_executor, write_scraping_logs, rows)
+        except Exception as exc:
+            logger.exception("Failed to write %d scraping log rows: %s", len(rows), exc)
+        finally:
+            for _ in rows:
+                _log_queue.task_done()
 
 <<<<<<< HEAD
-@app.post("/api/scrape", response_model=ScrapeResponse)
-async def trigger_scrape(request: ScrapeRequest = ScrapeRequest()):
-    """Trigger scraping of DraftKings odds and submission to CLM API."""
+async def scrape_one(sport: str, tournament: str, conf: Dict, stamps: RunTimestamps, force: bool = False) -> Tuple[int, int]:
+    """Scrape one tournament, create its game and submit the odds.
+    
+    Tournaments submitted in the last SCRAPE_CACHE_TTL seconds are skipped,
+    with no new game, unless `force`.
+    `stamps` is the run's start time, shared by every tournament it scrapes.
+    
+    Returns:
+        Tuple of (games created, teams found) for this tournament
+    """
+    async with _scrape_semaphore:
+        try:
+            logger.info("Processing %s - %s", sport, tournament)
+            loop = asyncio.get_running_loop()
+            
+            submitted = None if force else _scrape_cache.get((sport, tournament))
+            if submitted is not None:
+                game_id, num_teams = submitted
+                logger.info("Skipping %s - %s: already submitted as game %s", sport, tournament, game_id)
+                return 0, num_teams
+            
+            # Scrape the odds data
+            results = await loop.run_in_executor(
+                _scrape_executor, scrape_odds, conf["url"], conf["event_type"]
+            )
+            
+            # Extract teams data based on event type
+            teams_data = []
+            if conf["event_type"] == "championship":
+                teams_data = results.get("teams", [])
+            elif conf["event_type"] == "conference":
+                for conf_data in results.get("conferences", []):
+                    teams_data.extend(conf_data.get("teams", []))
+            elif conf["event_type"] == "division":
+                for div_data in results.get("divisions", []):
+                    teams_data.extend(div_data.get("teams", []))
+            
+            num_teams = len(teams_data)
+            
+            if num_teams == 0:
+                log_scraping_activity(sport, tournament, None, "warning", "No teams found")
+                return 0, 0
+            
+            # Create game data
+            current_time = stamps.game_time
+            game_data = GameData(
+                IdLeague=conf["id_league"],
+                IdGameType=conf["id_game_type"],
+                GameDateTime=current_time,
+                VisitorTeam=teams_data[0]["team"] if teams_data else "Unknown",
+                HomeTeam=teams_data[1]["team"] if len(teams_data) > 1 else "Unknown",
+                EventDate=current_time,
+                NumTeams=num_teams,
+                Description=conf["description"]
+            )
+            
+            # Create the game
+            game_id = await loop.run_in_executor(_scrape_executor, create_game, game_data)
+            if not game_id:
+                log_scraping_activity(sport, tournament, None, "error", "Failed to create game")
+                return 0, num_teams
+            
+            log_scraping_activity(sport, tournament, game_id, "success", f"Game created with {num_teams} teams")
+            
+            # Submit the odds
+            success = await loop.run_in_executor(
+                _scrape_executor, submit_game_odds, game_id, teams_data
+            )
+            if success:
+                log_scraping_activity(sport, tournament, game_id, "success", "Odds submitted successfully")
+                _scrape_cache[(sport, tournament)] = (game_id, num_teams)
+            else:
+                log_scraping_activity(sport, tournament, game_id, "error", "Failed to submit odds")
+            return 1, num_teams
+                
+        except Exception as exc:
+            logger.exception("Error processing %s - %s: %s", sport, tournament, exc)
+            log_scraping_activity(sport, tournament, None, "error", str(exc))
+            return 0, 0
+
+class ScrapeJob:
+    """Progress events of one background scrape, replayable by any number of listeners."""
+
+    def __init__(self):
+        self.id = uuid.uuid4().hex
+        self.events: List[Dict[str, Any]] = []
+        self.done = False
+        self._changed = asyncio.Condition()
+
+    async def publish(self, event: Dict[str, Any], last: bool = False):
+        """Record an event and wake every listener."""
+        async with self._changed:
+            self.events.append(event)
+            self.done = self.done or last
+            self._changed.notify_all()
+
+    async def stream(self) -> AsyncIterator[Dict[str, Any]]:
+        """Yield every event so far, then new ones until the job is done."""
+        index = 0
+        while True:
+            async with self._changed:
+                await self._changed.wait_for(lambda: index < len(self.events) or self.done)
+                pending = self.events[index:]
+            for event in pending:
+                yield event
+            index += len(pending)
+            if self.done and index == len(self.events):
+                return
+
+# Finished jobs stay readable for an hour
+_scrape_jobs = TTLCache(maxsize=32, ttl=3600)
+
+async def run_scrape(request: ScrapeRequest, force: bool = False, job: Optional[ScrapeJob] = None) -> ScrapeResponse:
+    """Scrape every requested tournament, publishing per-tournament progress to `job`."""
     try:
         logger.info("Starting scrape process")
         
         # If specific sport/tournament requested, filter CONFIG
-        config_to_process = CONFIG
+        sports = SPORT_KEYS
         if request.sport:
-            config_to_process = {k: v for k, v in CONFIG.items() if k.lower() == request.sport.lower()}
-            if not config_to_process:
+            sport = SPORTS_BY_NAME.get(request.sport.lower())
+            if sport is None:
                 raise HTTPException(status_code=404, detail=f"Sport '{request.sport}' not found")
+            sports = (sport,)
+        if request.tournament:
+            wanted_tournament = request.tournament.lower()
+            targets = [
+                (sport, TOURNAMENTS_BY_NAME[sport][wanted_tournament])
+                for sport in sports
+                if wanted_tournament in TOURNAMENTS_BY_NAME[sport]
+            ]
+        else:
+            targets = [(sport, tournament) for sport in sports for tournament in TOURNAMENTS[sport]]
         
-        games_created = 0
-        total_teams = 0
+        stamps = run_timestamps()
         
-        for sport, tournaments in config_to_process.items():
-            for tournament, conf in tournaments.items():
-                # Skip if specific tournament requested and doesn't match
-                if request.tournament and tournament.lower() != request.tournament.lower():
-                    continue
-                
-                try:
-                    logger.info("Processing %s - %s", sport, tournament)
-                    
-                    # Import and run the scraper logic
-                    from .scrapper import scrape_odds, create_game, submit_game_odds, GameData
-                    
-                    # Scrape the odds data
-                    results = scrape_odds(conf["url"], conf["event_type"])
-                    
-                    # Extract teams data based on event type
-                    teams_data = []
-                    if conf["event_type"] == "championship":
-                        teams_data = results.get("teams", [])
-                    elif conf["event_type"] == "conference":
-                        for conf_data in results.get("conferences", []):
-                            teams_data.extend(conf_data.get("teams", []))
-                    elif conf["event_type"] == "division":
-                        for div_data in results.get("divisions", []):
-                            teams_data.extend(div_data.get("teams", []))
-                    
-                    num_teams = len(teams_data)
-                    total_teams += num_teams
-                    
-                    if num_teams == 0:
-                        log_scraping_activity(sport, tournament, None, "warning", "No teams found")
-                        continue
-                    
-                    # Create game data
-                    current_time = datetime.utcnow().strftime("%Y-%m-%dT%H:%M")
-                    game_data = GameData(
-                        IdLeague=conf["id_league"],
-                        IdGameType=conf["id_game_type"],
-                        GameDateTime=current_time,
-                        VisitorTeam=teams_data[0]["team"] if teams_data else "Unknown",
-                        HomeTeam=teams_data[1]["team"] if len(teams_data) > 1 else "Unknown",
-                        EventDate=current_time,
-                        NumTeams=num_teams,
-                        Description=conf["description"]
-                    )
-                    
-                    # Create the game
-                    game_id = create_game(game_data)
-                    if game_id:
-                        games_created += 1
-                        log_scraping_activity(sport, tournament, game_id, "success", f"Game created with {num_teams} teams")
-                        
-                        # Submit the odds
-                        success = submit_game_odds(game_id, teams_data)
-                        if success:
-                            log_scraping_activity(sport, tournament, game_id, "success", "Odds submitted successfully")
-                        else:
-                            log_scraping_activity(sport, tournament, game_id, "error", "Failed to submit odds")
-                    else:
-                        log_scraping_activity(sport, tournament, None, "error", "Failed to create game")
-                        
-                except Exception as exc:
-                    logger.exception("Error processing %s - %s: %s", sport, tournament, exc)
-                    log_scraping_activity(sport, tournament, None, "error", str(exc))
+        async def scrape_and_report(sport: str, tournament: str, conf: Dict) -> Tuple[int, int]:
+            created, teams = await scrape_one(sport, tournament, conf, stamps, force)
+            if job is not None:
+                await job.publish({
+                    "event": "progress",
+                    "sport": sport,
+                    "tournament": tournament,
+                    "games_created": created,
+                    "teams": teams
+                })
+            return created, teams
         
-        return ScrapeResponse(
+        # Scrape every matching tournament concurrently; wall time is the slowest one
+        results = await asyncio.gather(*(
+            scrape_and_report(sport, tournament, CONFIG[sport][tournament])
+            for sport, tournament in targets
+        ))
+        games_created = sum(created for created, _ in results)
+        total_teams = sum(teams for _, teams in results)
+        
+        response = ScrapeResponse(
             status="success",
             message=f"Scraping completed. Created {games_created} games with {total_teams} total teams.",
             games_created=games_created,
             total_teams=total_teams
         )
+        if job is not None:
+            await job.publish({"event": "done", **response.model_dump()}, last=True)
+        return response
         
     except Exception as exc:
         logger.exception("Scraping failed: %s", exc)
+        if job is not None:
+            await job.publish({"event": "error", "message": f"Scraping failed: {str(exc)}"}, last=True)
         raise HTTPException(status_code=500, detail=f"Scraping failed: {str(exc)}")
+    finally:
+        if job is not None and not job.done:
+            await job.publish({"event": "error", "message": "Scrape was cancelled"}, last=True)
+
+@app.post("/api/scrape", response_model=ScrapeResponse)
+async def trigger_scrape(request: ScrapeRequest = ScrapeRequest(), force: bool = False):
+    """Trigger scraping of DraftKings odds and submission to CLM API.
+    
+    Pass ?force=true to ignore cached scrapes and re-read DraftKings.
+    """
+    return await run_scrape(request, force)
+
+# The scrape started by /api/scrape/background, if any
+_background_scrape: Optional[asyncio.Task] = None
+
+def _log_background_scrape(task: asyncio.Task):
+    """Log how a background scrape ended; its results are in /api/games."""
+    if task.cancelled():
+        logger.warning("Background scrape was cancelled")
+    elif task.exception() is not None:
+        logger.error("Background scrape failed: %s", task.exception())
+    else:
+        logger.info("Background scrape finished: %s", task.result().message)
+
+@app.post("/api/scrape/background", status_code=202)
+async def trigger_background_scrape(request: ScrapeRequest = ScrapeRequest(), force: bool = False):
+    """Start a scrape without holding the request open until it finishes.
+    
+    Progress can be followed at /api/jobs/{job_id}/events.
+    """
+    global _background_scrape
+    if _background_scrape is not None and not _background_scrape.done():
+        raise HTTPException(status_code=409, detail="A background scrape is already running")
+    
+    job = ScrapeJob()
+    _scrape_jobs[job.id] = job
+    _background_scrape = asyncio.create_task(run_scrape(request, force, job))
+    _background_scrape.add_done_callback(_log_background_scrape)
+    return {
+        "status": "accepted",
+        "job_id": job.id,
+        "message": f"Scrape started; poll /api/jobs/{job.id} or follow /api/jobs/{job.id}/events"
+    }
+
+def _get_job(job_id: str) -> ScrapeJob:
+    job = _scrape_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
+    return job
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Get a background scrape's status, finished tournaments and final result."""
+    job = _get_job(job_id)
+    progress = [event for event in job.events if event["event"] == "progress"]
+    last = job.events[-1] if job.done else None
+    return {
+        "job_id": job.id,
+        "status": last["event"] if last else "running",
+        "progress": progress,
+        "result": last
+    }
+
+@app.get("/api/jobs/{job_id}/events")
+async def stream_job_events(job_id: str):
+    """Stream a background scrape's progress as Server-Sent Events."""
+    job = _get_job(job_id)
+    
+    async def events():
+        async for event in job.stream():
+            yield b"event: " + event["event"].encode() + b"\ndata: " + orjson.dumps(event) + b"\n\n"
+    
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+async def start_log_writer():
+    """Start the background tasks that persist, archive and checkpoint scraping logs."""
+    global _log_writer, _log_archiver, _wal_checkpointer
+    _log_writer = asyncio.create_task(scraping_log_writer())
+    _log_archiver = asyncio.create_task(scraping_log_archiver())
+    _wal_checkpointer = asyncio.create_task(wal_checkpointer())
+
+async def stop_log_writer():
+    """Write any still-queued log rows, then stop the log writer."""
+    if _log_writer is None:
+        return
+    await _log_queue.join()
+    _log_writer.cancel()
+    _log_archiver.cancel()
+    _wal_checkpointer.cancel()
+    _log_executor.shutdown()
+    _read_executor.shutdown()
+
+def size_driver_pool():
+    """Allow one warm Chrome per tournament, up to the CPU count, for browser scrapes."""
+    DRIVER_POOL.size = min(os.cpu_count() or 1, len(CONFIG_ROWS))
+
+def close_driver_pool():
+    """Quit the pooled Chrome drivers."""
+    shutdown_drivers()
+
+def close_http_sessions():
+    """Close the pooled keep-alive connections to DraftKings and the CLM API."""
+    API_SESSION.close()
+    DK_SESSION.close()
 
 @app.get("/api/status")
 async def get_status():
@@ -210,32 +673,39 @@ async def get_status():
         "timestamp": datetime.utcnow().isoformat(),
         "version": "2.0.0",
         "config": {
-            "sports": list(CONFIG.keys()),
-            "total_tournaments": sum(len(tournaments) for tournaments in CONFIG.values())
+            "sports": list(SPORT_KEYS),
+            "total_tournaments": len(CONFIG_ROWS)
         }
     }
 
-@app.get("/api/games", response_model=List[GameLog])
-async def get_recent_games(limit: int = 50):
-    """Get recent games created."""
-    with closing(conn.cursor()) as cur:
-        rows = cur.execute(
-            "SELECT id, timestamp, sport, tournament, game_id, status, message FROM scraping_logs ORDER BY timestamp DESC LIMIT ?",
+def fetch_recent_logs(limit: int, table: str = "scraping_logs") -> List[sqlite3.Row]:
+    """Read the newest rows of a scraping log table on this thread's reader connection."""
+    with closing(_read_conn().cursor()) as cur:
+        return cur.execute(
+            "SELECT id, strftime('%Y-%m-%dT%H:%M:%f', timestamp_ms / 1000.0, 'unixepoch') AS timestamp, "
+            f"sport, tournament, game_id, status, message FROM {table} ORDER BY timestamp_ms DESC LIMIT ?",
             (limit,)
         ).fetchall()
-        
-        return [
-            GameLog(
-                id=row[0],
-                timestamp=row[1],
-                sport=row[2],
-                tournament=row[3],
-                game_id=row[4],
-                status=row[5],
-                message=row[6]
-            )
-            for row in rows
-        ]
+
+# Log rows are already well-typed, so they are returned as plain dicts without
+# per-row model validation; GameLog still documents the response schema
+@app.get("/api/games", response_model=None, responses={200: {"model": List[GameLog]}})
+async def get_recent_games(limit: int = 50):
+    """Get recent games created."""
+    # Let the log writer catch up so just-finished scrapes are listed
+    if _log_writer is not None:
+        await _log_queue.join()
+    rows = await asyncio.get_running_loop().run_in_executor(_read_executor, fetch_recent_logs, limit)
+    
+    return [dict(row) for row in rows]
+
+@app.get("/api/games/archive", response_model=None, responses={200: {"model": List[GameLog]}})
+async def get_archived_games(limit: int = 50):
+    """Get games logged more than a day ago."""
+    rows = await asyncio.get_running_loop().run_in_executor(
+        _read_executor, fetch_recent_logs, limit, "scraping_logs_archive"
+    )
+    return [dict(row) for row in rows]
 
 @app.get("/api/config")
 async def get_config():
@@ -249,8 +719,12 @@ async def root():
         "message": "DraftKings Odds Scraper API v2.0.0",
         "endpoints": {
             "POST /api/scrape": "Trigger scraping and submission to CLM API",
+            "POST /api/scrape/background": "Start scraping without waiting for it to finish",
+            "GET /api/jobs/{job_id}": "Get background scrape status",
+            "GET /api/jobs/{job_id}/events": "Stream background scrape progress (SSE)",
             "GET /api/status": "Get server status",
             "GET /api/games": "Get recent games created",
+            "GET /api/games/archive": "Get games logged more than a day ago",
             "GET /api/config": "Get current configuration"
         }
     }
@@ -259,144 +733,217 @@ if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
 =======
-# In-memory cache optional (not relied on for persistence)
-stored_odds: Dict[str, Dict[str, Dict[str, OddsData]]] = {}
+# SQLite is the only store; recently read JSON is cached briefly, already
+# decompressed, and dropped on write. Full documents are keyed by tournament,
+# typed slices by tournament plus event type.
+ODDS_CACHE_TTL = 5.0
+_odds_cache = TTLCache(maxsize=512, ttl=ODDS_CACHE_TTL)
+# Bumped per tournament on every committed write. A read that started before
+# the write may return the old row, so it only fills the cache if the
+# generation it started under is still current.
+_odds_generation: Dict[Tuple[str, str, str], int] = {}
 
-@app.post("/api/{provider}/{sport}/{tournament}")
-async def receive_odds(provider: str, sport: str, tournament: str, odds_data: OddsData):
-    provider = provider.lower()
-    sport = sport.lower()
-    if provider not in stored_odds:
-        stored_odds[provider] = {}
-    if sport not in stored_odds[provider]:
-        stored_odds[provider][sport] = {}
-    stored_odds[provider][sport][tournament] = odds_data
-
-    # Persist to SQLite as canonical storage
-    with closing(conn.cursor()) as cur:
-        cur.execute(
-            "INSERT OR REPLACE INTO odds(provider, sport, tournament, data) VALUES (?, ?, ?, ?)",
-            (provider, sport, tournament, json.dumps(odds_data.model_dump())),
-        )
-        conn.commit()
+# Shared strings, so each call reuses odds_conn's prepared statements
+SELECT_ODDS_SQL = "SELECT data FROM odds WHERE provider=? AND sport=? AND tournament=?"
+ODDS_EXISTS_SQL = "SELECT 1 FROM odds WHERE provider=? AND sport=? AND tournament=?"
+SELECT_TYPED_ODDS_SQL = "SELECT event_type, data FROM odds WHERE provider=? AND sport=? AND tournament=?"
+UPSERT_ODDS_SQL = (
+    "INSERT INTO odds(provider, sport, tournament, event_type, data) VALUES (?, ?, ?, ?, ?) "
+    "ON CONFLICT(provider, sport, tournament) DO UPDATE SET event_type=excluded.event_type, data=excluded.data"
+)
+
+def _fetch_odds(key: Tuple[str, str, str]) -> Optional[bytes]:
+    """Read and decompress one stored odds JSON document; runs on _odds_read_executor."""
+    row = _odds_read_conn().execute(SELECT_ODDS_SQL, key).fetchone()
+    return _odds_decompressor().decompress(row[0]) if row else None
+
+def _fetch_odds_field(key: Tuple[str, str, str], event_type: str, field: str) -> Optional[Tuple[str, Optional[bytes]]]:
+    """Read a stored payload's event type and, if it is `event_type`, one field as JSON.
     
-    # Count total teams for logging
-    total_teams = 0
-    if odds_data.event_type == "championship":
-        total_teams = len(odds_data.teams)
-    elif odds_data.event_type == "conference":
-        total_teams = sum(len(conf.teams) for conf in odds_data.conferences)
-    elif odds_data.event_type == "division":
-        total_teams = sum(len(div.teams) for div in odds_data.divisions)
+    The payload is only decompressed when the event type matches. Runs on
+    _odds_read_executor.
+    """
+    row = _odds_read_conn().execute(SELECT_TYPED_ODDS_SQL, key).fetchone()
+    if row is None:
+        return None
+    stored_type, data = row
+    if stored_type != event_type:
+        return stored_type, None
+    payload = orjson.loads(_odds_decompressor().decompress(data))
+    return stored_type, orjson.dumps({field: payload.get(field, [])})
+
+def _odds_exist(key: Tuple[str, str, str]) -> bool:
+    """Check for a stored odds row without reading its data; runs on _odds_read_executor."""
+    return _odds_read_conn().execute(ODDS_EXISTS_SQL, key).fetchone() is not None
+
+def _store_odds_batch(rows: List[Tuple[str, str, str, str, str]]):
+    """Compress and upsert a batch of odds payloads in one transaction; runs on _odds_executor."""
+    compressed = [(*row[:4], _odds_compressor.compress(row[4].encode())) for row in rows]
+    with odds_conn:
+        odds_conn.executemany(UPSERT_ODDS_SQL, compressed)
+
+# Scrapers POST many tournaments at once; the writer commits whatever arrives
+# within ODDS_BATCH_WINDOW seconds together, so a burst pays for one commit.
+# Each POST still waits for the commit that includes its row.
+ODDS_BATCH_SIZE = 64
+ODDS_BATCH_WINDOW = 0.05
+_odds_queue: "asyncio.Queue[Tuple[Tuple[str, str, str], str, str, asyncio.Future]]" = asyncio.Queue()
+_odds_writer: Optional[asyncio.Task] = None
+
+async def odds_writer():
+    """Upsert queued odds payloads in batches and resolve their POSTs."""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await _odds_queue.get()]
+        deadline = loop.time() + ODDS_BATCH_WINDOW
+        while len(batch) < ODDS_BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_odds_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        # The last POST for a tournament wins, as it would with separate commits
+        latest = {}
+        for key, event_type, data, _ in batch:
+            latest[key] = (event_type, data)
+        try:
+            await loop.run_in_executor(
+                _odds_executor, _store_odds_batch, [(*key, *value) for key, value in latest.items()]
+            )
+        except Exception as exc:
+            logger.exception("Failed to store %d odds payloads: %s", len(latest), exc)
+            for *_, done in batch:
+                if not done.done():
+                    done.set_exception(exc)
+        else:
+            for *_, done in batch:
+                if not done.done():
+                    done.set_result(None)
+
+async def start_odds_writer():
+    """Start the background task that persists received odds."""
+    global _odds_writer
+    _odds_writer = asyncio.create_task(odds_writer())
+
+async def stop_odds_writer():
+    """Stop the odds writer."""
+    if _odds_writer is not None:
+        _odds_writer.cancel()
+    _odds_executor.shutdown()
+    _odds_read_executor.shutdown()
+
+@asynccontextmanager
+async def odds_lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Run the odds writer for as long as the app serves; pass as FastAPI(lifespan=...)."""
+    await start_odds_writer()
+    yield
+    await stop_odds_writer()
+
+async def _load_odds_json(provider: str, sport: str, tournament: str) -> Optional[bytes]:
+    """Return the stored odds JSON for a tournament, or None if there is none."""
+    key = (provider, sport, tournament)
+    data = _odds_cache.get(key)
+    if data is not None:
+        return data
+    generation = _odds_generation.get(key, 0)
+    data = await asyncio.get_running_loop().run_in_executor(_odds_read_executor, _fetch_odds, key)
+    if data is not None and _odds_generation.get(key, 0) == generation:
+        _odds_cache[key] = data
+    return data
+
+# Provider and sport path segments are lowercased once, while FastAPI validates
+# them, so every endpoint builds the same cache and database key
+Provider = Annotated[str, AfterValidator(str.lower)]
+Sport = Annotated[str, AfterValidator(str.lower)]
+
+@app.post("/api/{provider}/{sport}/{tournament}")
+async def receive_odds(provider: Provider, sport: Sport, tournament: str, odds_data: OddsData):
+    key = (provider, sport, tournament)
+
+    # Persist to SQLite as canonical storage; Pydantic serializes straight to
+    # JSON without building a dict first
+    committed = asyncio.get_running_loop().create_future()
+    _odds_queue.put_nowait((key, odds_data.event_type, odds_data.model_dump_json(), committed))
+    # Count total teams for logging while the writer commits the row
+    total_teams = _count_total_teams(odds_data)
+    await committed
+    # The next read loads the committed row, so readers never see an unsaved
+    # payload; reads already in flight may hold the old row and must not cache it
+    _odds_generation[key] = _odds_generation.get(key, 0) + 1
+    _odds_cache.pop(key, None)
+    for event_type in _TYPED_ODDS_FIELDS:
+        _odds_cache.pop((*key, event_type), None)
     
-    logger.info(
-        "Received %s teams for %s %s %s (%s)",
-        total_teams,
-        provider.upper(),
-        sport.upper(),
-        tournament.replace('-', ' ').title(),
-        odds_data.event_type,
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Received %s teams for %s %s %s (%s)",
+            total_teams,
+            provider.upper(),
+            sport.upper(),
+            tournament.replace('-', ' ').title(),
+            odds_data.event_type,
+        )
     return {"status": "success", "event_type": odds_data.event_type, "total_teams": total_teams}
 
 @app.get("/api/{provider}/{sport}/{tournament}")
-async def get_odds(provider: str, sport: str, tournament: str):
-    provider = provider.lower()
-    sport = sport.lower()
-    # Try cache first
-    if provider in stored_odds and sport in stored_odds[provider] and tournament in stored_odds[provider][sport]:
-        return {"odds": stored_odds[provider][sport][tournament]}
-    # Fallback to SQLite persistence
-    with closing(conn.cursor()) as cur:
-        row = cur.execute(
-            "SELECT data FROM odds WHERE provider=? AND sport=? AND tournament=?",
-            (provider, sport, tournament),
-        ).fetchone()
-        if row:
-            try:
-                # Return the exact JSON blob we stored so clients see the same payload
-                return json.loads(row[0])
-            except Exception:
-                logger.exception("Failed to decode JSON for %s/%s/%s", provider, sport, tournament)
+async def get_odds(provider: Provider, sport: Sport, tournament: str):
+    data = await _load_odds_json(provider, sport, tournament)
+    if data is not None:
+        # Return the JSON we stored as-is, without parsing and re-encoding it
+        return Response(content=data, media_type="application/json")
     return {"error": "No odds data available for this sport and tournament"}, 404
 
+# The payload field each typed endpoint returns, keyed by event type
+_TYPED_ODDS_FIELDS = {"championship": "teams", "conference": "conferences", "division": "divisions"}
+
+async def _get_typed_odds(provider: str, sport: str, tournament: str, event_type: str):
+    """Return the `event_type` field of the stored odds, if the tournament is of that type.
+    
+    Encoded slices are cached like full documents, so repeat GETs skip the
+    decompress, parse and re-encode.
+    """
+    key = (provider, sport, tournament)
+    cache_key = (*key, event_type)
+    body = _odds_cache.get(cache_key)
+    if body is None:
+        generation = _odds_generation.get(key, 0)
+        row = await asyncio.get_running_loop().run_in_executor(
+            _odds_read_executor, _fetch_odds_field, key, event_type, _TYPED_ODDS_FIELDS[event_type]
+        )
+        if row is None:
+            return {"error": "No odds data available"}, 404
+        _, body = row
+        if body is None:
+            return {"error": f"This tournament is not a {event_type} event"}, 400
+        if _odds_generation.get(key, 0) == generation:
+            _odds_cache[cache_key] = body
+    return Response(content=body, media_type="application/json")
+
 # New endpoints for specific data access
 @app.get("/api/{provider}/{sport}/{tournament}/championship")
-async def get_championship_odds(provider: str, sport: str, tournament: str):
+async def get_championship_odds(provider: Provider, sport: Sport, tournament: str):
     """Get championship odds as a flat list of teams"""
-    provider = provider.lower()
-    sport = sport.lower()
-    if provider in stored_odds and sport in stored_odds[provider] and tournament in stored_odds[provider][sport]:
-        data = stored_odds[provider][sport][tournament]
-        if data.event_type == "championship":
-            return {"teams": data.teams}
-        else:
-            return {"error": "This tournament is not a championship event"}, 400
-    # Fallback to DB
-    with closing(conn.cursor()) as cur:
-        row = cur.execute(
-            "SELECT data FROM odds WHERE provider=? AND sport=? AND tournament=?",
-            (provider, sport, tournament),
-        ).fetchone()
-        if row:
-            try:
-                payload = json.loads(row[0])
-                if payload.get("event_type") == "championship":
-                    return {"teams": payload.get("teams", [])}
-            except Exception:
-                logger.exception("Failed to decode JSON for %s/%s/%s", provider, sport, tournament)
-    return {"error": "No odds data available"}, 404
+    return await _get_typed_odds(provider, sport, tournament, "championship")
 
 @app.get("/api/{provider}/{sport}/{tournament}/conferences")
-async def get_conference_odds(provider: str, sport: str, tournament: str):
+async def get_conference_odds(provider: Provider, sport: Sport, tournament: str):
     """Get conference odds grouped by conference"""
-    provider = provider.lower()
-    sport = sport.lower()
-    if provider in stored_odds and sport in stored_odds[provider] and tournament in stored_odds[provider][sport]:
-        data = stored_odds[provider][sport][tournament]
-        if data.event_type == "conference":
-            return {"conferences": data.conferences}
-        else:
-            return {"error": "This tournament is not a conference event"}, 400
-    # Fallback to DB
-    with closing(conn.cursor()) as cur:
-        row = cur.execute(
-            "SELECT data FROM odds WHERE provider=? AND sport=? AND tournament=?",
-            (provider, sport, tournament),
-        ).fetchone()
-        if row:
-            try:
-                payload = json.loads(row[0])
-                if payload.get("event_type") == "conference":
-                    return {"conferences": payload.get("conferences", [])}
-            except Exception:
-                logger.exception("Failed to decode JSON for %s/%s/%s", provider, sport, tournament)
-    return {"error": "No odds data available"}, 404
+    return await _get_typed_odds(provider, sport, tournament, "conference")
 
 @app.get("/api/{provider}/{sport}/{tournament}/divisions")
-async def get_division_odds(provider: str, sport: str, tournament: str):
+async def get_division_odds(provider: Provider, sport: Sport, tournament: str):
     """Get division odds grouped by division"""
-    provider = provider.lower()
-    sport = sport.lower()
-    if provider in stored_odds and sport in stored_odds[provider] and tournament in stored_odds[provider][sport]:
-        data = stored_odds[provider][sport][tournament]
-        if data.event_type == "division":
-            return {"divisions": data.divisions}
-        else:
-            return {"error": "This tournament is not a division event"}, 400
-    # Fallback to DB
-    with closing(conn.cursor()) as cur:
-        row = cur.execute(
-            "SELECT data FROM odds WHERE provider=? AND sport=? AND tournament=?",
-            (provider, sport, tournament),
-        ).fetchone()
-        if row:
-            try:
-                payload = json.loads(row[0])
-                if payload.get("event_type") == "division":
-                    return {"divisions": payload.get("divisions", [])}
-            except Exception:
-                logger.exception("Failed to decode JSON for %s/%s/%s", provider, sport, tournament)
+    return await _get_typed_odds(provider, sport, tournament, "division")
+
+# Team counters keyed by event type; each walks the payload once
+_teams = attrgetter("teams")
+_TEAM_COUNTERS = {
+    "championship": lambda odds_data: len(odds_data.teams),
+    "conference": lambda odds_data: sum(map(len, map(_teams, odds_data.conferences))),
+    "division": lambda odds_data: sum(map(len, map(_teams, odds_data.divisions))),
+}
 
 
 def _count_total_teams(odds_data: OddsData) -> int:
@@ -406,18 +953,13 @@ def _count_total_teams(odds_data: OddsData) -> int:
         odds_data: The odds data to count teams from
         
     Returns:
-        Total number of teams
+        Total number of teams, or 0 for unknown event types
     """
-    if odds_data.event_type == "championship":
-        return len(odds_data.teams)
-    elif odds_data.event_type == "conference":
-        return sum(len(conf.teams) for conf in odds_data.conferences)
-    elif odds_data.event_type == "division":
-        return sum(len(div.teams) for div in odds_data.divisions)
-    return 0
+    counter = _TEAM_COUNTERS.get(odds_data.event_type)
+    return counter(odds_data) if counter else 0
 
 
-def _has_odds_data(provider: str, sport: str, tournament: str) -> bool:
+async def _has_odds_data(provider: str, sport: str, tournament: str) -> bool:
     """Check if odds data exists for the given parameters.
     
     Args:
@@ -428,9 +970,8 @@ def _has_odds_data(provider: str, sport: str, tournament: str) -> bool:
     Returns:
         True if data exists, False otherwise
     """
-    return (
-        provider in stored_odds
-        and sport in stored_odds[provider]
-        and tournament in stored_odds[provider][sport]
-    )
+    key = (provider, sport, tournament)
+    if key in _odds_cache:
+        return True
+    return await asyncio.get_running_loop().run_in_executor(_odds_read_executor, _odds_exist, key)
 >>>>>>> 0967c96d35ccf3ba31b1ed299fb51952f4f64c4c
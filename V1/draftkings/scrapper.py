@@ -11,41 +11,60 @@ backend. It supports multiple sports (NFL, NBA, WNBA) and tournament types
 >>>>>>> 0967c96d35ccf3ba31b1ed299fb51952f4f64c4c
 
 Functions:
+    DriverPool: Headless Chrome drivers kept warm and reused across scrapes
+    fetch_market_board: Read a page's odds from DraftKings' JSON API
     scrape_odds: Main scraping function that handles different event types
     scrape_championship_odds: Scrapes flat list of teams for championships
     scrape_conference_odds: Scrapes teams grouped by conference
     scrape_division_odds: Scrapes teams grouped by division
     scrape_simple_odds: Fallback scraper for unknown event types
+    scrape_all: Scrape every CONFIG tournament in a pool of worker processes
     run_scraper: Iterate CONFIG and send results to API
 """
 
 import os
-import json
+import copy
+import shutil
+import tempfile
+import atexit
+import functools
 import logging
+import multiprocessing
+import multiprocessing.util
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
 <<<<<<< HEAD
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+from concurrent.futures import Future
+from typing import Dict, Iterator, List, Any, NamedTuple, Optional, Tuple
+from datetime import datetime, timezone
 =======
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any, NamedTuple, Optional, Tuple
+from datetime import datetime, timezone
 >>>>>>> 0967c96d35ccf3ba31b1ed299fb51952f4f64c4c
 
-import requests
+import httpx
+import orjson
+from cachetools import TTLCache
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 <<<<<<< HEAD
 from selenium.webdriver.chrome.service import Service
 =======
 >>>>>>> 0967c96d35ccf3ba31b1ed299fb51952f4f64c4c
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
 from dotenv import load_dotenv
+from webdriver_manager.chrome import ChromeDriverManager
 <<<<<<< HEAD
 from pydantic import BaseModel
-from webdriver_manager.chrome import ChromeDriverManager
 =======
-from datetime import datetime
 >>>>>>> 0967c96d35ccf3ba31b1ed299fb51952f4f64c4c
 
 # Initialize logging early
@@ -57,6 +76,19 @@ logger = logging.getLogger("draftkings_scraper")
 
 load_dotenv()
 
+# Shared by every HTTP client below; sized for the API server's concurrent
+# scrapes so no thread has to open a throwaway connection
+HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+
+# One pooled HTTP/2 client for every API POST so concurrent sends share the
+# same keep-alive connection instead of reconnecting each time. Bodies are
+# pre-serialized with orjson and sent as content=.
+API_SESSION = httpx.Client(
+    http2=True,
+    limits=HTTP_LIMITS,
+    headers={"Content-Type": "application/json"},
+)
+
 # Base URL for API, configurable via env var
 <<<<<<< HEAD
 API_BASE_URL = os.getenv("API_BASE_URL", "https://clmapi.sportsfanwagers.com")
@@ -167,17 +199,144 @@ CONFIG = {
 >>>>>>> 0967c96d35ccf3ba31b1ed299fb51952f4f64c4c
 }
 
-def scrape_odds(url: str, event_type: str = "championship") -> Dict[str, Any]:
-    """Main scraping function that handles different event types.
+# CONFIG is static, so its key views are materialized once at import
+SPORT_KEYS = tuple(CONFIG)
+TOURNAMENTS = {sport: tuple(tournaments) for sport, tournaments in CONFIG.items()}
+# Case-insensitive lookups for sport names given by API callers
+SPORTS_BY_NAME = {sport.lower(): sport for sport in SPORT_KEYS}
+TOURNAMENTS_BY_NAME = {
+    sport: {tournament.lower(): tournament for tournament in tournaments}
+    for sport, tournaments in TOURNAMENTS.items()
+}
+
+class TournamentConf(NamedTuple):
+    """One CONFIG tournament, flattened for single-level iteration."""
+    sport: str
+    tournament: str
+    url: str
+    event_type: str
+    conf: Dict[str, Any]
+
+# Every CONFIG tournament in order, so batch scrapes walk one flat tuple
+# instead of nested dict views
+CONFIG_ROWS = tuple(
+    TournamentConf(sport, tournament, conf["url"], conf["event_type"], conf)
+    for sport, tournaments in CONFIG.items()
+    for tournament, conf in tournaments.items()
+)
+
+# DraftKings pages load their odds from this JSON API, so reading it directly
+# skips Chrome entirely. Set DRAFTKINGS_USE_BROWSER=1 to always use Selenium.
+USE_BROWSER = os.getenv("DRAFTKINGS_USE_BROWSER", "").lower() in ("1", "true", "yes")
+DK_API_URL = "https://sportsbook-nash.draftkings.com/sites/US-SB/api/v5/eventgroups/{event_group_id}?format=json"
+# The event group document only carries offers for its default subcategory;
+# every other subcategory's offers come from its own, much smaller, document
+DK_SUBCATEGORY_API_URL = (
+    "https://sportsbook-nash.draftkings.com/sites/US-SB/api/v5/eventgroups/{event_group_id}"
+    "/categories/{category_id}/subcategories/{subcategory_id}?format=json"
+)
+
+# Event group behind each league page, keyed by the page's URL path
+DK_EVENT_GROUPS = {
+    "/leagues/football/nfl": 88808,
+    "/leagues/basketball/nba": 42648,
+}
+
+DK_SESSION = httpx.Client(
+    http2=True,
+    limits=HTTP_LIMITS,
+    headers={
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Accept": "application/json",
+    },
+)
+
+class RateLimiter:
+    """Thread-safe token bucket allowing `rate` requests per second.
+    
+    Up to `burst` requests go through at once; callers beyond that sleep
+    until a token refills.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+# Concurrent scrapes share one limiter per host so DraftKings is never flooded
+DK_MAX_REQUESTS_PER_SECOND = float(os.getenv("DRAFTKINGS_MAX_RPS", "5"))
+_RATE_LIMITERS: Dict[str, RateLimiter] = {}
+_RATE_LIMITERS_LOCK = threading.Lock()
+
+def _throttle(url: str) -> None:
+    """Wait for the rate limiter of `url`'s host."""
+    host = urlparse(url).netloc
+    with _RATE_LIMITERS_LOCK:
+        limiter = _RATE_LIMITERS.get(host)
+        if limiter is None:
+            limiter = _RATE_LIMITERS[host] = RateLimiter(DK_MAX_REQUESTS_PER_SECOND)
+    limiter.acquire()
+
+class MarketBoard(NamedTuple):
+    """Texts shown on a DraftKings market board, in page order.
+    
+    team_divisions holds, for each team, the index into divisions of the
+    header it is listed under (-1 for teams listed before any header).
+    """
+    teams: List[str]
+    odds: List[str]
+    divisions: List[str]
+    team_divisions: List[int]
+
+# CSS selectors for the elements read off each DraftKings market board
+TEAM_TITLE_SELECTOR = 'span[data-testid="button-title-market-board"]'
+ODDS_SELECTOR = 'span[data-testid="button-odds-market-board"]'
+DIVISION_TITLE_SELECTOR = "div.cb-title__simple-title.cb-title__nav-title"
+
+# Walks the team, odds and division header elements in document order and
+# returns their texts, so a page is read in one WebDriver round-trip instead
+# of serializing page_source. Each team is tagged with the header above it.
+_EXTRACT_BOARD_JS = """
+const [teamSelector, oddsSelector, divisionSelector] = arguments;
+const board = {teams: [], odds: [], divisions: [], team_divisions: []};
+for (const el of document.querySelectorAll([teamSelector, oddsSelector, divisionSelector].join(", "))) {
+    const text = el.textContent.trim();
+    if (el.matches(divisionSelector)) {
+        board.divisions.push(text);
+    } else if (el.matches(teamSelector)) {
+        board.teams.push(text);
+        board.team_divisions.push(board.divisions.length - 1);
+    } else {
+        board.odds.push(text);
+    }
+}
+return board;
+"""
+
+def _build_chrome_options() -> Options:
+    """Build the Chrome flags shared by every DraftKings scrape.
     
-    Args:
-        url: The DraftKings URL to scrape
-        event_type: Type of event ('championship', 'conference', 'division')
-        
     Returns:
-        Dictionary containing scraped odds data structured by event type
+        Chrome options without a profile directory
     """
     chrome_options = Options()
+    # Return from navigation at DOMContentLoaded; explicit waits cover the odds rows
+    chrome_options.page_load_strategy = "eager"
 <<<<<<< HEAD
     chrome_options.add_argument("--headless")
     chrome_options.add_argument("--disable-gpu")
@@ -186,36 +345,360 @@ def scrape_odds(url: str, event_type: str = "championship") -> Dict[str, Any]:
     chrome_options.add_argument("--window-size=1920,1080")
     chrome_options.add_argument("--disable-extensions")
     chrome_options.add_argument("--disable-plugins")
-    chrome_options.add_argument("--disable-images")
-    chrome_options.add_argument("--disable-javascript")
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_argument("--disable-background-networking")
     chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 6.3; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
+=======
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-background-networking")
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+>>>>>>> 0967c96d35ccf3ba31b1ed299fb51952f4f64c4c
+    # Odds are plain DOM text; skip images, stylesheets and fonts entirely
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.stylesheets": 2,
+        "profile.managed_default_content_settings.fonts": 2,
+    })
+    return chrome_options
+
+# Chrome flags never change between launches, so they are built once
+CHROME_OPTIONS = _build_chrome_options()
 
+# The content-setting prefs do not stop font files, preloaded images or
+# tracking beacons, so those requests are blocked at the network layer
+BLOCKED_URL_PATTERNS = [
+    "*.woff", "*.woff2", "*.ttf", "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.webp",
+    "*google-analytics*", "*googletagmanager*", "*doubleclick*",
+]
+
+def _block_static_assets(driver: webdriver.Chrome) -> None:
+    """Block BLOCKED_URL_PATTERNS in the driver's current tab.
+    
+    Args:
+        driver: Chrome driver whose focused tab is about to load a page; CDP
+            network settings apply per tab
+    """
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+
+@functools.lru_cache(maxsize=None)
+def _chromedriver_path() -> str:
+    """Resolve (and on first use download) the chromedriver binary once per process.
+    
+    Returns:
+        Path of the chromedriver executable
+    """
+    return ChromeDriverManager().install()
+
+def _create_driver(profile_dir: str) -> webdriver.Chrome:
+    """Start a headless Chrome instance configured for DraftKings pages.
+    
+    Args:
+        profile_dir: Chrome user data directory; reusing one keeps its disk
+            cache warm across relaunches
+        
+    Returns:
+        A new Chrome WebDriver
+    """
+    chrome_options = copy.deepcopy(CHROME_OPTIONS)
+    chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+<<<<<<< HEAD
     # Use webdriver-manager for Windows Server 2012 compatibility
     try:
-        service = Service(ChromeDriverManager().install())
+        service = Service(_chromedriver_path())
         driver = webdriver.Chrome(service=service, options=chrome_options)
     except Exception as exc:
         logger.warning("Failed to use webdriver-manager, trying default Chrome driver: %s", exc)
         driver = webdriver.Chrome(options=chrome_options)
 =======
-    chrome_options.add_argument("--headless=new")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--window-size=1920,1080")
-
     driver = webdriver.Chrome(options=chrome_options)
 >>>>>>> 0967c96d35ccf3ba31b1ed299fb51952f4f64c4c
+    return driver
+
+# Longest a scrape waits for a pooled Chrome before giving up
+DRIVER_WAIT_TIMEOUT = float(os.getenv("DRAFTKINGS_DRIVER_WAIT_TIMEOUT", "300"))
+
+class DriverPool:
+    """Headless Chrome drivers kept warm and handed out one caller at a time.
+    
+    Chrome takes seconds to start, so drivers are created on first demand (up
+    to `size`) and reused by every scrape in this process. Selenium drivers
+    are not thread-safe; callers beyond `size` wait for a driver to free up,
+    or for a discarded driver's slot so they can start its replacement.
+    Each driver slot keeps its own profile directory, so a replacement driver
+    starts with the previous one's profile and HTTP disk cache.
+    """
+
+    def __init__(self, size: int = 1, wait_timeout: float = DRIVER_WAIT_TIMEOUT):
+        self.size = size
+        self.wait_timeout = wait_timeout
+        # _idle, _created and the profile bookkeeping are guarded by _cond
+        self._idle: List[webdriver.Chrome] = []
+        self._created = 0
+        self._cond = threading.Condition()
+        self._profile_root: Optional[str] = None
+        self._free_profiles: List[str] = []
+        self._profiles: Dict[int, str] = {}
+        self._profile_count = 0
+
+    @contextmanager
+    def acquire(self) -> Iterator[webdriver.Chrome]:
+        """Borrow a driver for the duration of a `with` block.
+        
+        A driver that raises WebDriverException (crashed browser, lost
+        session) is quit so a later acquire starts a fresh one.
+        
+        Raises:
+            TimeoutError: No driver became free within `wait_timeout` seconds
+        """
+        driver = self._take()
+        try:
+            yield driver
+        except TimeoutException:
+            self._release(driver)
+            raise
+        except WebDriverException:
+            self._discard(driver)
+            raise
+        except BaseException:
+            self._release(driver)
+            raise
+        self._release(driver)
+
+    def close(self) -> None:
+        """Quit every idle driver, and drop the profiles once none are running."""
+        with self._cond:
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._discard(driver)
+        with self._cond:
+            if self._created == 0 and self._profile_root is not None:
+                shutil.rmtree(self._profile_root, ignore_errors=True)
+                self._profile_root = None
+                self._free_profiles.clear()
+
+    def _take(self) -> webdriver.Chrome:
+        with self._cond:
+            # Woken by _release (a driver is idle) or _discard (a slot is free)
+            if not self._cond.wait_for(lambda: self._idle or self._created < self.size, self.wait_timeout):
+                raise TimeoutError(f"No Chrome driver became free within {self.wait_timeout:g}s")
+            if self._idle:
+                return self._idle.pop()
+            self._created += 1
+            profile_dir = self._claim_profile()
+        try:
+            driver = _create_driver(profile_dir)
+        except Exception:
+            self._free_slot(profile_dir)
+            raise
+        with self._cond:
+            self._profiles[id(driver)] = profile_dir
+        return driver
+
+    def _claim_profile(self) -> str:
+        # Caller holds self._cond
+        if self._free_profiles:
+            return self._free_profiles.pop()
+        if self._profile_root is None:
+            self._profile_root = tempfile.mkdtemp(prefix="dk_scraper_")
+        self._profile_count += 1
+        return os.path.join(self._profile_root, f"profile-{self._profile_count}")
+
+    def _free_slot(self, profile_dir: Optional[str]) -> None:
+        with self._cond:
+            self._created -= 1
+            if profile_dir is not None:
+                self._free_profiles.append(profile_dir)
+            self._cond.notify()
+
+    def _release(self, driver: webdriver.Chrome) -> None:
+        try:
+            # Keep one tournament's session state from leaking into the next
+            driver.delete_all_cookies()
+        except WebDriverException:
+            self._discard(driver)
+            return
+        with self._cond:
+            self._idle.append(driver)
+            self._cond.notify()
+
+    def _discard(self, driver: webdriver.Chrome) -> None:
+        with self._cond:
+            profile_dir = self._profiles.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as exc:
+            logger.warning("Failed to quit Chrome driver: %s", exc)
+        # Freed only after quit, so a waiter's replacement reuses the profile
+        self._free_slot(profile_dir)
+
+DRIVER_POOL = DriverPool()
+
+def shutdown_drivers() -> None:
+    """Quit the Chrome drivers held by this process's pool."""
+    DRIVER_POOL.close()
+
+atexit.register(shutdown_drivers)
+
+def _slugify(name: str) -> str:
+    """Turn a subcategory name like "Super Bowl" into its URL form "super-bowl"."""
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+# Every tournament of a league reads the same multi-megabyte event group
+# document, so each decoded document is shared for DK_EVENT_GROUP_TTL seconds
+DK_EVENT_GROUP_TTL = 60
+_event_groups: TTLCache = TTLCache(maxsize=32, ttl=DK_EVENT_GROUP_TTL)
+_event_groups_lock = threading.Lock()
+_event_group_downloads: Dict[str, threading.Lock] = {}
+
+def _get_event_group(api_url: str) -> Dict[str, Any]:
+    """Return the decoded eventGroup of a DraftKings API document.
+    
+    Concurrent scrapes of one league wait for a single download rather than
+    each fetching the same document.
+    
+    Args:
+        api_url: DK_API_URL or DK_SUBCATEGORY_API_URL, formatted
+        
+    Returns:
+        The document's eventGroup object
+    """
+    with _event_groups_lock:
+        event_group = _event_groups.get(api_url)
+        if event_group is not None:
+            return event_group
+        download_lock = _event_group_downloads.setdefault(api_url, threading.Lock())
+    with download_lock:
+        with _event_groups_lock:
+            event_group = _event_groups.get(api_url)
+        if event_group is None:
+            _throttle(api_url)
+            response = DK_SESSION.get(api_url, timeout=10)
+            response.raise_for_status()
+            # Event group documents run to megabytes; orjson decodes them far faster
+            event_group = orjson.loads(response.content)["eventGroup"]
+            with _event_groups_lock:
+                _event_groups[api_url] = event_group
+    return event_group
+
+def _find_subcategory(event_group: Dict[str, Any], subcategory: str) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """Return the (offer category, subcategory descriptor) whose name slugifies to `subcategory`."""
+    for category in event_group.get("offerCategories", []):
+        for descriptor in category.get("offerSubcategoryDescriptors", []):
+            if _slugify(descriptor.get("name", "")) == subcategory:
+                return category, descriptor
+    return None
+
+def fetch_market_board(url: str) -> Optional[MarketBoard]:
+    """Read a page's market board from DraftKings' JSON odds API.
+    
+    Args:
+        url: The DraftKings page URL the odds are shown on
+        
+    Returns:
+        MarketBoard for the page's subcategory, or None if the league is not
+        mapped in DK_EVENT_GROUPS or the response has no matching offers
+    """
+    parsed = urlparse(url)
+    event_group_id = DK_EVENT_GROUPS.get(parsed.path.rstrip("/"))
+    subcategory = parse_qs(parsed.query).get("subcategory", [None])[0]
+    if event_group_id is None or subcategory is None:
+        return None
+
+    event_group = _get_event_group(DK_API_URL.format(event_group_id=event_group_id))
+    found = _find_subcategory(event_group, subcategory)
+    if found is None:
+        logger.warning("DraftKings event group %s has no %s subcategory", event_group_id, subcategory)
+        return None
+    category, descriptor = found
+    events = event_group.get("events", [])
+    if "offerSubcategory" not in descriptor:
+        subcategory_group = _get_event_group(DK_SUBCATEGORY_API_URL.format(
+            event_group_id=event_group_id,
+            category_id=category["offerCategoryId"],
+            subcategory_id=descriptor["subcategoryId"],
+        ))
+        found = _find_subcategory(subcategory_group, subcategory)
+        if found is None or "offerSubcategory" not in found[1]:
+            logger.warning("DraftKings returned no %s offers for event group %s", subcategory, event_group_id)
+            return None
+        descriptor = found[1]
+        events = events + subcategory_group.get("events", [])
+    event_names = {str(event["eventId"]): event["name"] for event in events}
+
+    board = MarketBoard(teams=[], odds=[], divisions=[], team_divisions=[])
+    for event_offers in descriptor["offerSubcategory"].get("offers", []):
+        # Offers come grouped per event; each event is one division/conference board
+        for offer in event_offers if isinstance(event_offers, list) else [event_offers]:
+            board.divisions.append(event_names.get(str(offer.get("eventId")), offer.get("label", "")))
+            for outcome in offer.get("outcomes", []):
+                board.teams.append(outcome["label"])
+                board.odds.append(outcome["oddsAmerican"])
+                board.team_divisions.append(len(board.divisions) - 1)
+    return board if board.teams else None
+
+def _read_market_board(url: str, driver: Optional[webdriver.Chrome] = None) -> MarketBoard:
+    """Load a DraftKings page in Chrome and read its market board.
+    
+    Args:
+        url: The DraftKings URL to scrape
+        driver: Chrome driver to scrape with; defaults to one from DRIVER_POOL
+        
+    Returns:
+        MarketBoard read from the rendered page
+    """
+    if driver is not None:
+        return _load_market_board(driver, url)
+    with DRIVER_POOL.acquire() as driver:
+        return _load_market_board(driver, url)
+
+def _load_market_board(driver: webdriver.Chrome, url: str) -> MarketBoard:
+    """Open `url` in a new tab of `driver`, read its market board, close the tab."""
+    # Load each tournament in its own tab so the browser stays up between scrapes
+    base_handle = driver.current_window_handle
+    driver.switch_to.new_window("tab")
     try:
+        # Set before navigating so the page's first requests are filtered too
+        _block_static_assets(driver)
+        _throttle(url)
         driver.get(url)
         # Explicit wait for odds buttons to appear
         WebDriverWait(driver, 20).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, 'span[data-testid="button-odds-market-board"]'))
+            EC.presence_of_element_located((By.CSS_SELECTOR, ODDS_SELECTOR))
         )
-        page_source = driver.page_source
+        return MarketBoard(**driver.execute_script(
+            _EXTRACT_BOARD_JS, TEAM_TITLE_SELECTOR, ODDS_SELECTOR, DIVISION_TITLE_SELECTOR
+        ))
     finally:
-        driver.quit()
+        driver.close()
+        driver.switch_to.window(base_handle)
 
-    soup = BeautifulSoup(page_source, "html.parser")
+def scrape_odds(url: str, event_type: str = "championship", driver: Optional[webdriver.Chrome] = None) -> Dict[str, Any]:
+    """Main scraping function that handles different event types.
+    
+    Odds come from DraftKings' JSON API when the page is mapped there, and
+    from a headless Chrome render otherwise (or always, with USE_BROWSER).
+    
+    Args:
+        url: The DraftKings URL to scrape
+        event_type: Type of event ('championship', 'conference', 'division')
+        driver: Chrome driver for the browser path; defaults to one from DRIVER_POOL
+        
+    Returns:
+        Dictionary containing scraped odds data structured by event type
+    """
+    board = None
+    if not USE_BROWSER:
+        try:
+            board = fetch_market_board(url)
+        except (httpx.HTTPError, ValueError, KeyError) as exc:
+            logger.warning("DraftKings odds API failed for %s, falling back to browser: %s", url, exc)
+    if board is None:
+        board = _read_market_board(url, driver)
 
     # Route to appropriate scraper based on event type
     scrapers = {
@@ -224,45 +707,35 @@ def scrape_odds(url: str, event_type: str = "championship") -> Dict[str, Any]:
         "division": scrape_division_odds
     }
     
-    return scrapers.get(event_type, scrape_simple_odds)(soup)
+    return scrapers.get(event_type, scrape_simple_odds)(board)
 
-def scrape_championship_odds(soup: BeautifulSoup) -> Dict[str, Any]:
+def _pair_teams(board: MarketBoard) -> List[Dict[str, str]]:
+    """Pair each team title with the odds shown next to it."""
+    return [{"team": team, "odds": odds} for team, odds in zip(board.teams, board.odds)]
+
+def scrape_championship_odds(board: MarketBoard) -> Dict[str, Any]:
     """Scrape championship odds as a flat list of all teams.
     
     Args:
-        soup: BeautifulSoup object of the scraped page
+        board: Market board read from the page
         
     Returns:
         Dictionary with event_type and teams list
     """
-    team_elements = soup.find_all("span", {"data-testid": "button-title-market-board"})
-    odds_elements = soup.find_all("span", {"data-testid": "button-odds-market-board"})
-    
-    teams = [
-        {"team": team.get_text(strip=True), "odds": odd.get_text(strip=True)}
-        for team, odd in zip(team_elements, odds_elements)
-    ]
+    teams = _pair_teams(board)
     
     return {"event_type": "championship", "teams": teams}
 
-def scrape_conference_odds(soup: BeautifulSoup) -> Dict[str, Any]:
+def scrape_conference_odds(board: MarketBoard) -> Dict[str, Any]:
     """Scrape conference odds with teams grouped by conference.
     
     Args:
-        soup: BeautifulSoup object of the scraped page
+        board: Market board read from the page
         
     Returns:
         Dictionary with event_type, conferences list, and validation data
     """
-    team_spans = soup.find_all("span", {"data-testid": "button-title-market-board"})
-    odds_spans = soup.find_all("span", {"data-testid": "button-odds-market-board"})
-    
-    # Create teams list with bounds checking
-    teams = [
-        {"team": team_span.get_text(strip=True), "odds": odds_spans[i].get_text(strip=True)}
-        for i, team_span in enumerate(team_spans)
-        if i < len(odds_spans)
-    ]
+    teams = _pair_teams(board)
     
     # Split teams into conferences (first half = NFC, second half = AFC)
     total_teams = len(teams)
@@ -284,44 +757,49 @@ def scrape_conference_odds(soup: BeautifulSoup) -> Dict[str, Any]:
         }
     }
 
-def scrape_division_odds(soup: BeautifulSoup) -> Dict[str, Any]:
+@functools.lru_cache(maxsize=64)
+def _parse_division_title(division_text: str) -> Tuple[str, str]:
+    """Split a division header such as "NFL 2025/26 - NFC East".
+    
+    Headers repeat on every scrape, so results are memoized.
+    
+    Args:
+        division_text: Header text from the page
+        
+    Returns:
+        Tuple of (conference, division), e.g. ("NFC", "East")
+    """
+    full_division = division_text.rpartition(" - ")[2]  # Extract "NFC East" from full title
+    conference, _, division = full_division.partition(" ")
+    division = division.strip()
+    if not division:
+        return full_division, "Unknown"
+    return conference, division
+
+def scrape_division_odds(board: MarketBoard) -> Dict[str, Any]:
     """Scrape division odds with teams grouped by division.
     
     Args:
-        soup: BeautifulSoup object of the scraped page
+        board: Market board read from the page
         
     Returns:
         Dictionary with event_type, divisions list, and validation data
     """
-    division_titles = soup.find_all("div", class_="cb-title__simple-title cb-title__nav-title")
-    team_spans = soup.find_all("span", {"data-testid": "button-title-market-board"})
-    odds_spans = soup.find_all("span", {"data-testid": "button-odds-market-board"})
-    
-    # Create teams list with bounds checking
-    teams = [
-        {"team": team_span.get_text(strip=True), "odds": odds_spans[i].get_text(strip=True)}
-        for i, team_span in enumerate(team_spans)
-        if i < len(odds_spans)
-    ]
+    teams = _pair_teams(board)
+    
+    # Group teams under the header they were listed below; teams listed
+    # before the first header belong to the first division
+    grouped_teams = [[] for _ in board.divisions]
+    if grouped_teams:
+        for team, index in zip(teams, board.team_divisions):
+            grouped_teams[max(index, 0)].append(team)
     
     # Extract division names and create divisions
     divisions = []
-    teams_per_division = len(teams) // len(division_titles) if division_titles else 0
     
-    for i, title in enumerate(division_titles):
-        division_text = title.get_text(strip=True)
-        full_division = division_text.split(" - ")[-1]  # Extract "NFC East" from full title
-        
-        # Parse conference and division
-        parts = full_division.split()
-        conference = parts[0] if len(parts) >= 2 else full_division
-        division = " ".join(parts[1:]) if len(parts) >= 2 else "Unknown"
-        
-        # Get teams for this division
-        start_idx = i * teams_per_division
-        end_idx = start_idx + teams_per_division if i < len(division_titles) - 1 else len(teams)
+    for division_text, division_teams in zip(board.divisions, grouped_teams):
+        conference, division = _parse_division_title(division_text)
         
-        division_teams = teams[start_idx:end_idx]
         if division_teams:
             divisions.append({
                 "division": division,
@@ -340,25 +818,62 @@ def scrape_division_odds(soup: BeautifulSoup) -> Dict[str, Any]:
         }
     }
 
-def scrape_simple_odds(soup: BeautifulSoup) -> Dict[str, Any]:
+def scrape_simple_odds(board: MarketBoard) -> Dict[str, Any]:
     """Fallback scraper for unknown event types.
     
     Args:
-        soup: BeautifulSoup object of the scraped page
+        board: Market board read from the page
         
     Returns:
         Dictionary with event_type and teams list (defaults to championship format)
     """
-    team_elements = soup.find_all("span", {"data-testid": "button-title-market-board"})
-    odds_elements = soup.find_all("span", {"data-testid": "button-odds-market-board"})
-    
-    teams = [
-        {"team": team.get_text(strip=True), "odds": odd.get_text(strip=True)}
-        for team, odd in zip(team_elements, odds_elements)
-    ]
+    teams = _pair_teams(board)
     
     return {"event_type": "championship", "teams": teams}
 
+def _init_scrape_worker() -> None:
+    """Give a pool worker its own Chrome and quit it when the worker exits."""
+    global DRIVER_POOL
+    # A forked worker inherits the parent's driver handles; never share those sessions
+    DRIVER_POOL = DriverPool()
+    multiprocessing.util.Finalize(None, shutdown_drivers, exitpriority=10)
+
+def _scrape_task(url: str, event_type: str) -> Optional[Dict[str, Any]]:
+    """Run scrape_odds inside a pool worker, logging instead of raising."""
+    try:
+        return scrape_odds(url, event_type)
+    except Exception as exc:
+        logger.exception("Failed scraping %s: %s", url, exc)
+        return None
+
+def scrape_all(processes: int = 4) -> Dict[Tuple[str, str], Optional[Dict[str, Any]]]:
+    """Scrape every CONFIG tournament in parallel worker processes.
+    
+    Meant for batch jobs that only need the odds; run_scraper also submits
+    them to the API and runs on threads instead. Selenium drivers are not
+    thread-safe, so each worker process keeps its own Chrome (see DriverPool)
+    and reuses it for every tournament it is handed.
+    
+    Args:
+        processes: Number of worker processes, i.e. concurrent Chrome instances
+        
+    Returns:
+        Dictionary mapping (sport, tournament) to the scraped odds, or None if
+        that tournament failed
+    """
+    keys = [(row.sport, row.tournament) for row in CONFIG_ROWS]
+    tasks = [(row.url, row.event_type) for row in CONFIG_ROWS]
+    
+    pool = multiprocessing.Pool(processes, initializer=_init_scrape_worker)
+    try:
+        results = pool.starmap(_scrape_task, tasks)
+    finally:
+        # close + join (not terminate) so each worker's Finalize quits its Chrome
+        pool.close()
+        pool.join()
+    
+    return dict(zip(keys, results))
+
 <<<<<<< HEAD
 def create_game(game_data: GameData) -> Optional[int]:
     """Create a game in the CLM API and return the game ID.
@@ -372,9 +887,12 @@ def create_game(game_data: GameData) -> Optional[int]:
     endpoint = f"{API_BASE_URL}/api/Game/InsertGame"
     
     try:
-        response = requests.post(endpoint, json=game_data.model_dump(), timeout=30)
+        # GameData was validated on construction and holds only JSON-native
+        # fields, so its field dict is already the payload; orjson encodes it
+        # without another pass through Pydantic's serializer
+        response = API_SESSION.post(endpoint, content=orjson.dumps(game_data.__dict__), timeout=30)
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             game_id = result.get("idGame") or result.get("IdGame")
             logger.info("Created game with ID: %s", game_id)
             return game_id
@@ -398,16 +916,13 @@ def submit_game_odds(game_id: int, teams_data: List[Dict[str, Any]]) -> bool:
     endpoint = f"{API_BASE_URL}/api/Game/InsertGameValuesTNT?idGame={game_id}"
     
     # Convert teams data to GameValuesTNT format
-    game_values = []
-    for i, team in enumerate(teams_data, 1):
-        game_values.append({
-            "Id": i,
-            "TeamName": team["team"],
-            "Odds": team["odds"]
-        })
+    game_values = [
+        {"Id": i, "TeamName": team["team"], "Odds": team["odds"]}
+        for i, team in enumerate(teams_data, 1)
+    ]
     
     try:
-        response = requests.post(endpoint, json=game_values, timeout=30)
+        response = API_SESSION.post(endpoint, content=orjson.dumps(game_values), timeout=30)
         if response.status_code == 200:
             logger.info("Successfully submitted odds for game %s with %s teams", game_id, len(game_values))
             return True
@@ -418,13 +933,24 @@ def submit_game_odds(game_id: int, teams_data: List[Dict[str, Any]]) -> bool:
         logger.exception("Exception submitting odds for game %s: %s", game_id, exc)
         return False
 
+# CLM has no bulk odds endpoint, so run_scraper hands each game's POST to this
+# pool and moves on to scraping the next tournament while it is in flight
+_SUBMIT_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="submit")
+
+def _log_submit_result(sport: str, tournament: str, game_id: int, future: Future) -> None:
+    """Log the outcome of a background submit_game_odds call."""
+    if future.result():
+        logger.info("Successfully processed %s - %s with game ID %s", sport, tournament, game_id)
+    else:
+        logger.error("Failed to submit odds for %s - %s", sport, tournament)
+
 =======
 >>>>>>> 0967c96d35ccf3ba31b1ed299fb51952f4f64c4c
-def _post_with_retries(endpoint: str, payload: Dict[str, Any], max_retries: int = 3) -> requests.Response:
+def _post_with_retries(endpoint: str, payload: Dict[str, Any], max_retries: int = 3) -> httpx.Response:
     last_exc: Exception | None = None
     for attempt in range(1, max_retries + 1):
         try:
-            response = requests.post(endpoint, json=payload, timeout=20)
+            response = API_SESSION.post(endpoint, content=orjson.dumps(payload), timeout=20)
             if response.status_code < 500:
                 return response
             logger.warning("Server error %s on attempt %s for %s", response.status_code, attempt, endpoint)
@@ -436,118 +962,137 @@ def _post_with_retries(endpoint: str, payload: Dict[str, Any], max_retries: int
     return response  # type: ignore[name-defined]
 
 
-def run_scraper() -> None:
+class RunTimestamps(NamedTuple):
+    """UTC start of one scraper run, formatted once for all of its tournaments."""
+    game_time: str  # GameDateTime / EventDate sent to CLM API
+    file_stamp: str  # Suffix of the saved scrape files
+
+def run_timestamps() -> RunTimestamps:
+    """Format the current UTC time for a new scraper run."""
+    started = datetime.now(timezone.utc)
+    return RunTimestamps(started.strftime("%Y-%m-%dT%H:%M"), started.strftime("%Y%m%dT%H%M%SZ"))
+
+
+def _process_tournament(sport: str, tournament: str, conf: Dict[str, Any], stamps: RunTimestamps) -> None:
 <<<<<<< HEAD
-    """Loop through all CONFIG items, scrape, create games, and submit odds to CLM API."""
-    for sport, tournaments in CONFIG.items():
-        for tournament, conf in tournaments.items():
-            url = conf["url"]
-            event_type = conf["event_type"]
-            id_league = conf["id_league"]
-            id_game_type = conf["id_game_type"]
-            description = conf["description"]
-            
-            logger.info("Scraping %s - %s", sport, tournament)
-            try:
-                # Scrape the odds data
-                results = scrape_odds(url, event_type)
-                
-                # Extract teams data based on event type
-                teams_data = []
-                if event_type == "championship":
-                    teams_data = results.get("teams", [])
-                elif event_type == "conference":
-                    for conf_data in results.get("conferences", []):
-                        teams_data.extend(conf_data.get("teams", []))
-                elif event_type == "division":
-                    for div_data in results.get("divisions", []):
-                        teams_data.extend(div_data.get("teams", []))
-                
-                num_teams = len(teams_data)
-                logger.info("Scraped %s teams for %s - %s", num_teams, sport, tournament)
-                
-                if num_teams == 0:
-                    logger.warning("No teams found for %s - %s, skipping", sport, tournament)
-                    continue
-                
-                # Create game data
-                current_time = datetime.utcnow().strftime("%Y-%m-%dT%H:%M")
-                game_data = GameData(
-                    IdLeague=id_league,
-                    IdGameType=id_game_type,
-                    GameDateTime=current_time,
-                    VisitorTeam=teams_data[0]["team"] if teams_data else "Unknown",
-                    HomeTeam=teams_data[1]["team"] if len(teams_data) > 1 else "Unknown",
-                    EventDate=current_time,
-                    NumTeams=num_teams,
-                    Description=description
-                )
-                
-                # Create the game
-                game_id = create_game(game_data)
-                if not game_id:
-                    logger.error("Failed to create game for %s - %s", sport, tournament)
-                    continue
-                
-                # Submit the odds
-                success = submit_game_odds(game_id, teams_data)
-                if success:
-                    logger.info("Successfully processed %s - %s with game ID %s", sport, tournament, game_id)
-                else:
-                    logger.error("Failed to submit odds for %s - %s", sport, tournament)
-                
+    """Scrape one CONFIG tournament, create its game, and submit its odds to CLM API."""
+    url = conf["url"]
+    event_type = conf["event_type"]
+    id_league = conf["id_league"]
+    id_game_type = conf["id_game_type"]
+    description = conf["description"]
+    
+    logger.info("Scraping %s - %s", sport, tournament)
+    try:
+        # Scrape the odds data
+        results = scrape_odds(url, event_type)
+        
+        # Extract teams data based on event type
+        teams_data = []
+        if event_type == "championship":
+            teams_data = results.get("teams", [])
+        elif event_type == "conference":
+            for conf_data in results.get("conferences", []):
+                teams_data.extend(conf_data.get("teams", []))
+        elif event_type == "division":
+            for div_data in results.get("divisions", []):
+                teams_data.extend(div_data.get("teams", []))
+        
+        num_teams = len(teams_data)
+        logger.info("Scraped %s teams for %s - %s", num_teams, sport, tournament)
+        
+        if num_teams == 0:
+            logger.warning("No teams found for %s - %s, skipping", sport, tournament)
+            return
+        
+        # Create game data
+        current_time = stamps.game_time
+        game_data = GameData(
+            IdLeague=id_league,
+            IdGameType=id_game_type,
+            GameDateTime=current_time,
+            VisitorTeam=teams_data[0]["team"] if teams_data else "Unknown",
+            HomeTeam=teams_data[1]["team"] if len(teams_data) > 1 else "Unknown",
+            EventDate=current_time,
+            NumTeams=num_teams,
+            Description=description
+        )
+        
+        # Create the game
+        game_id = create_game(game_data)
+        if not game_id:
+            logger.error("Failed to create game for %s - %s", sport, tournament)
+            return
+        
+        # Submit the odds in the background; the pool is joined at exit
+        future = _SUBMIT_EXECUTOR.submit(submit_game_odds, game_id, teams_data)
+        future.add_done_callback(functools.partial(_log_submit_result, sport, tournament, game_id))
+        
 =======
-    """Loop through all CONFIG items, scrape, and send to API."""
-    for sport, tournaments in CONFIG.items():
-        for tournament, conf in tournaments.items():
-            url = conf["url"]
-            endpoint = conf["endpoint"]
-            event_type = conf["event_type"]
-            logger.info("Scraping %s - %s", sport, tournament)
-            try:
-                results = scrape_odds(url, event_type)
-                logger.info("Scraped %s items for %s - %s", (
-                    len(results.get("teams", []))
-                    if event_type == "championship"
-                    else sum(len(c.get("teams", [])) for c in results.get("conferences", []))
-                    if event_type == "conference"
-                    else sum(len(d.get("teams", [])) for d in results.get("divisions", []))
-                ), sport, tournament)
+    """Scrape one CONFIG tournament and send the results to the API."""
+    url = conf["url"]
+    endpoint = conf["endpoint"]
+    event_type = conf["event_type"]
+    logger.info("Scraping %s - %s", sport, tournament)
+    try:
+        results = scrape_odds(url, event_type)
+        logger.info("Scraped %s items for %s - %s", (
+            len(results.get("teams", []))
+            if event_type == "championship"
+            else sum(len(c.get("teams", [])) for c in results.get("conferences", []))
+            if event_type == "conference"
+            else sum(len(d.get("teams", [])) for d in results.get("divisions", []))
+        ), sport, tournament)
 
 >>>>>>> 0967c96d35ccf3ba31b1ed299fb51952f4f64c4c
-                # Save to JSON for inspection
-                save_dir = os.path.join(os.getcwd(), "scrapes")
-                os.makedirs(save_dir, exist_ok=True)
-                timestamp = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
-                safe_sport = sport.lower().replace(" ", "-")
-                safe_tournament = tournament.lower().replace(" ", "-")
-                file_path = os.path.join(save_dir, f"draftkings_{safe_sport}_{safe_tournament}_{timestamp}.json")
-                with open(file_path, "w", encoding="utf-8") as f:
-                    json.dump({
-                        "provider": "draftkings",
-                        "sport": sport,
-                        "tournament": tournament,
-                        "event_type": event_type,
+        # Save to JSON for inspection
+        save_dir = os.path.join(os.getcwd(), "scrapes")
+        os.makedirs(save_dir, exist_ok=True)
+        timestamp = stamps.file_stamp
+        safe_sport = sport.lower().replace(" ", "-")
+        safe_tournament = tournament.lower().replace(" ", "-")
+        file_path = os.path.join(save_dir, f"draftkings_{safe_sport}_{safe_tournament}_{timestamp}.json")
+        Path(file_path).write_bytes(orjson.dumps({
+            "provider": "draftkings",
+            "sport": sport,
+            "tournament": tournament,
+            "event_type": event_type,
 <<<<<<< HEAD
-                        "game_id": game_id,
-                        "data": results
-                    }, f, ensure_ascii=False, indent=2)
-                logger.info("Saved scrape to %s", file_path)
-                
+            "game_id": game_id,
+            "data": results
+        }, option=orjson.OPT_INDENT_2))
+        logger.info("Saved scrape to %s", file_path)
+        
 =======
-                        "data": results
-                    }, f, ensure_ascii=False, indent=2)
-                logger.info("Saved scrape to %s", file_path)
-
-                response = _post_with_retries(endpoint, results)
-                if response.status_code == 200:
-                    data = response.json()
-                    logger.info("Posted to %s | event=%s total_teams=%s", endpoint, data.get("event_type"), data.get("total_teams"))
-                else:
-                    logger.error("Failed POST to %s | status=%s body=%s", endpoint, response.status_code, response.text)
+            "data": results
+        }, option=orjson.OPT_INDENT_2))
+        logger.info("Saved scrape to %s", file_path)
+
+        response = _post_with_retries(endpoint, results)
+        if response.status_code == 200:
+            data = orjson.loads(response.content)
+            logger.info("Posted to %s | event=%s total_teams=%s", endpoint, data.get("event_type"), data.get("total_teams"))
+        else:
+            logger.error("Failed POST to %s | status=%s body=%s", endpoint, response.status_code, response.text)
 >>>>>>> 0967c96d35ccf3ba31b1ed299fb51952f4f64c4c
-            except Exception as exc:
-                logger.exception("Failed processing %s - %s: %s", sport, tournament, exc)
+    except Exception as exc:
+        logger.exception("Failed processing %s - %s: %s", sport, tournament, exc)
+
+
+# Tournaments are independent, so run_scraper works through several at once.
+# DraftKings API requests stay within DRAFTKINGS_MAX_RPS, and browser
+# fallbacks wait on DRIVER_POOL for a free Chrome.
+SCRAPE_WORKERS = int(os.getenv("DRAFTKINGS_SCRAPE_WORKERS", "4"))
+
+def run_scraper() -> None:
+    """Scrape every CONFIG tournament, up to SCRAPE_WORKERS at a time."""
+    # Browser fallbacks can then run side by side too, one Chrome per worker
+    DRIVER_POOL.size = max(DRIVER_POOL.size, SCRAPE_WORKERS)
+    # File names already carry sport and tournament, so one stamp per run is unique
+    stamps = run_timestamps()
+    with ThreadPoolExecutor(max_workers=SCRAPE_WORKERS, thread_name_prefix="scrape") as executor:
+        for row in CONFIG_ROWS:
+            executor.submit(_process_tournament, row.sport, row.tournament, row.conf, stamps)
 
 
 <<<<<<< HEAD
@@ -590,7 +1135,7 @@ def test_payload_generation():
     print(f"   Teams: {[team['team'] for team in sample_teams_data]}")
     
     # Generate current timestamp
-    current_time = datetime.utcnow().strftime("%Y-%m-%dT%H:%M")
+    current_time = run_timestamps().game_time
     
     print(f"\n2. GENERATING GAME CREATION PAYLOAD (InsertGame):")
     print("-" * 50)
@@ -611,7 +1156,7 @@ def test_payload_generation():
     game_payload = game_data.model_dump()
     
     print("PAYLOAD STRUCTURE:")
-    print(json.dumps(game_payload, indent=2, ensure_ascii=False))
+    print(orjson.dumps(game_payload, option=orjson.OPT_INDENT_2).decode())
     
     print(f"\n3. GENERATING ODDS PAYLOAD (InsertGameValuesTNT):")
     print("-" * 50)
@@ -626,7 +1171,7 @@ def test_payload_generation():
         })
     
     print("PAYLOAD STRUCTURE:")
-    print(json.dumps(game_values, indent=2, ensure_ascii=False))
+    print(orjson.dumps(game_values, option=orjson.OPT_INDENT_2).decode())
     
     print(f"\n4. VALIDATION SUMMARY:")
     print("-" * 50)
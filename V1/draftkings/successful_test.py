@@ -139,6 +139,7 @@ def scrape_superbowl_odds():
     url = "https://sportsbook.draftkings.com/leagues/football/nfl?category=futures&subcategory=super-bowl"
     
     chrome_options = Options()
+    chrome_options.page_load_strategy = "eager"
     chrome_options.add_argument("--headless")
     chrome_options.add_argument("--disable-gpu")
     chrome_options.add_argument("--no-sandbox")
@@ -146,9 +147,13 @@ def scrape_superbowl_odds():
     chrome_options.add_argument("--window-size=1920,1080")
     chrome_options.add_argument("--disable-extensions")
     chrome_options.add_argument("--disable-plugins")
-    chrome_options.add_argument("--disable-images")
-    chrome_options.add_argument("--disable-javascript")
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
     chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 6.3; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.stylesheets": 2,
+        "profile.managed_default_content_settings.fonts": 2,
+    })
 
     # Use webdriver-manager for Windows Server 2012 compatibility
     try:
@@ -176,7 +181,7 @@ def scrape_superbowl_odds():
     finally:
         driver.quit()
 
-    soup = BeautifulSoup(page_source, "html.parser")
+    soup = BeautifulSoup(page_source, "lxml")
     
     # Scrape championship odds as a flat list of all teams
     team_elements = soup.find_all("span", {"data-testid": "button-title-market-board"})
@@ -13,11 +13,10 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import TimeoutException
 from bs4 import BeautifulSoup
 import logging
 from webdriver_manager.chrome import ChromeDriverManager
-import time
-import random
 
 # Configure detailed logging
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -27,6 +26,7 @@ def setup_driver(headless=False):  # Set to False to see the browser
     """Setup Chrome driver with proper options for DraftKings."""
     logger.info("🚗 Setting up Chrome driver")
     options = Options()
+    options.page_load_strategy = "eager"
     if headless:
         options.add_argument('--headless')
     options.add_argument('--no-sandbox')
@@ -56,9 +56,14 @@ def inspect_page(url):
         logger.info(f"🌐 Navigating to: {url}")
         driver.get(url)
         
-        # Wait for page to load
+        # Wait for the market board to render instead of a fixed delay
         logger.info("⏳ Waiting for page to load...")
-        time.sleep(5)
+        try:
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, '[data-testid="button-title-market-board"]'))
+            )
+        except TimeoutException:
+            logger.warning("⚠️ Market board not found, inspecting the page as loaded")
         
         # Take a screenshot for debugging
         try:
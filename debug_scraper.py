@@ -7,7 +7,6 @@ from flask import Flask, request, jsonify
 from flask_cors import CORS
 import json
 import time
-import random
 import requests
 from datetime import datetime
 from typing import Dict, List, Any, Optional
@@ -17,6 +16,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import TimeoutException
 from bs4 import BeautifulSoup
 import logging
 from webdriver_manager.chrome import ChromeDriverManager
@@ -215,6 +215,7 @@ def setup_driver(headless=True):
     """Setup Chrome driver with proper options for DraftKings."""
     logger.info("🚗 Setting up Chrome driver")
     options = Options()
+    options.page_load_strategy = "eager"
     if headless:
         options.add_argument('--headless')
     options.add_argument('--no-sandbox')
@@ -223,9 +224,16 @@ def setup_driver(headless=True):
     options.add_argument('--window-size=1920,1080')
     options.add_argument('--disable-extensions')
     options.add_argument('--disable-plugins')
-    options.add_argument('--disable-images')
+    options.add_argument('--blink-settings=imagesEnabled=false')
+    options.add_argument('--disable-background-networking')
     options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
     
+    options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.managed_default_content_settings.stylesheets': 2,
+        'profile.managed_default_content_settings.fonts': 2,
+    })
+    
     try:
         service = Service(ChromeDriverManager().install())
         driver = webdriver.Chrome(service=service, options=options)
@@ -541,9 +549,14 @@ def scrape_draftkings_odds_debug(url, event_type="championship"):
             logger.warning("❌ No elements found with any selector")
             return []
         
-        # Wait a bit more for dynamic content
+        # Wait until enough odds rows have rendered rather than sleeping blindly
         logger.info("⏳ Waiting for dynamic content to load...")
-        time.sleep(random.uniform(2, 4))
+        try:
+            WebDriverWait(driver, 15).until(
+                lambda d: len(d.find_elements(By.CSS_SELECTOR, 'span[data-testid="button-odds-market-board"]')) >= 4
+            )
+        except TimeoutException:
+            logger.warning("⚠️ Fewer than 4 odds elements rendered, parsing what is available")
         
         # Parse the HTML
         logger.info("🔍 Parsing HTML content...")
@@ -11,12 +11,12 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from bs4 import BeautifulSoup
 import logging
 from webdriver_manager.chrome import ChromeDriverManager
-import time
 import random
 import re
 
@@ -28,6 +28,7 @@ def setup_driver(headless=True):
     """Setup Chrome driver with proper options for DraftKings."""
     logger.info("🚗 Setting up Chrome driver")
     options = Options()
+    options.page_load_strategy = "eager"
     if headless:
         options.add_argument('--headless')
     options.add_argument('--no-sandbox')
@@ -36,9 +37,15 @@ def setup_driver(headless=True):
     options.add_argument('--window-size=1920,1080')
     options.add_argument('--disable-extensions')
     options.add_argument('--disable-plugins')
-    options.add_argument('--disable-images')
+    options.add_argument('--blink-settings=imagesEnabled=false')
     options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
     
+    options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.managed_default_content_settings.stylesheets': 2,
+        'profile.managed_default_content_settings.fonts': 2,
+    })
+    
     try:
         service = Service(ChromeDriverManager().install())
         driver = webdriver.Chrome(service=service, options=options)
@@ -82,7 +89,12 @@ def simple_debug_scrape(url):
         
         # Wait for page to load
         logger.info("⏳ Waiting for page to load...")
-        time.sleep(10)  # Wait longer
+        try:
+            WebDriverWait(driver, 15).until(
+                EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'span[data-testid="button-odds-market-board"]'))
+            )
+        except TimeoutException:
+            logger.warning("⚠️ Odds elements did not appear within 15s, inspecting page as-is")
         
         # Get page source
         soup = BeautifulSoup(driver.page_source, 'html.parser')
@@ -4,6 +4,8 @@ import json
 import time
 import random
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 from selenium import webdriver
@@ -12,11 +14,20 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+import soupsieve
 from bs4 import BeautifulSoup
 import logging
 from webdriver_manager.chrome import ChromeDriverManager
 import os
 import re
+import atexit
+import copy
+import functools
+import inspect
+import threading
+from operator import methodcaller
+from cachetools import TTLCache
+from selenium.common.exceptions import TimeoutException, WebDriverException
 
 app = Flask(__name__)
 CORS(app)
@@ -25,6 +36,15 @@ CORS(app)
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# CLM API calls share one pooled session, so a game POST and its odds POST
+# reuse a keep-alive connection instead of each paying a new TLS handshake.
+# Only failed connects are retried; retrying a sent POST could insert twice.
+_clm_session = requests.Session()
+_clm_session.mount(
+    "https://clmapi.sportsfanwagers.com",
+    HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=Retry(connect=3, read=0, backoff_factor=0.5)),
+)
+
 # Classes and functions from successful_test.py
 class SevenDigitIDGenerator:
     """Generates sequential 7-digit IDs starting from user-specified number."""
@@ -171,35 +191,35 @@ def extract_grand_prix_name(url, tournament_name):
     # If no specific Grand Prix found, use the tournament name
     return tournament_name
 
+# Common selectors for race/event titles, compiled once rather than on every scrape
+RACE_TITLE_SELECTORS = tuple(map(soupsieve.compile, (
+    '.cb-title__simple-title.cb-title__nav-title',  # DraftKings specific
+    '.cb-title__simple-title',
+    '.cb-title__nav-title',
+    '.title',
+    '.event-title',
+    '.race-title',
+    '.tournament-title',
+    'h1',
+    'h2',
+    '[class*="title"]',
+    '[class*="event"]',
+    '[class*="race"]'
+)))
+
 def extract_race_name_from_page(soup, tournament_type):
     """Extract the actual race/event name from the page content."""
     race_name = None
     
-    # Common selectors for race/event titles
-    title_selectors = [
-        '.cb-title__simple-title.cb-title__nav-title',  # DraftKings specific
-        '.cb-title__simple-title',
-        '.cb-title__nav-title',
-        '.title',
-        '.event-title',
-        '.race-title',
-        '.tournament-title',
-        'h1',
-        'h2',
-        '[class*="title"]',
-        '[class*="event"]',
-        '[class*="race"]'
-    ]
-    
     logger.info(f"Extracting race name from page for tournament type: {tournament_type}")
     
-    for selector in title_selectors:
+    for selector in RACE_TITLE_SELECTORS:
         try:
-            elements = soup.select(selector)
+            elements = selector.select(soup)
             for element in elements:
                 text = element.get_text(strip=True)
                 if text and len(text) > 3:  # Ensure it's meaningful text
-                    logger.info(f"Found potential race name: '{text}' using selector: {selector}")
+                    logger.info(f"Found potential race name: '{text}' using selector: {selector.pattern}")
                     
                     # Clean up the text
                     race_name = text.strip()
@@ -223,7 +243,7 @@ def extract_race_name_from_page(soup, tournament_type):
                         return race_name
                         
         except Exception as e:
-            logger.debug(f"Selector {selector} failed: {e}")
+            logger.debug(f"Selector {selector.pattern} failed: {e}")
             continue
     
     logger.warning("No race name found in page content")
@@ -543,9 +563,21 @@ def process_odds(odds_str):
         # If parsing fails, return original odds
         return odds_str
 
+BLOCKED_URL_PATTERNS = [
+    '*.woff', '*.woff2', '*.ttf', '*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.webp',
+    '*google-analytics*', '*googletagmanager*', '*doubleclick*',
+]
+
+@functools.lru_cache(maxsize=None)
+def chromedriver_path():
+    """Resolve the chromedriver binary once; drivers are recreated after crashes."""
+    return ChromeDriverManager().install()
+
 def setup_driver(headless=True):
     """Setup Chrome driver with proper options for DraftKings."""
     options = Options()
+    # Return from get() at DOMContentLoaded; explicit waits cover the odds rows
+    options.page_load_strategy = "eager"
     if headless:
         options.add_argument('--headless')
     options.add_argument('--no-sandbox')
@@ -554,22 +586,146 @@ def setup_driver(headless=True):
     options.add_argument('--window-size=1920,1080')
     options.add_argument('--disable-extensions')
     options.add_argument('--disable-plugins')
-    options.add_argument('--disable-images')
+    options.add_argument('--blink-settings=imagesEnabled=false')
+    options.add_argument('--disable-background-networking')
     options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
     
+    # Odds are plain DOM text; skip images, stylesheets and fonts entirely
+    options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.managed_default_content_settings.stylesheets': 2,
+        'profile.managed_default_content_settings.fonts': 2,
+    })
+    
     try:
-        service = Service(ChromeDriverManager().install())
+        service = Service(chromedriver_path())
         driver = webdriver.Chrome(service=service, options=options)
     except Exception as e:
         logger.warning(f"Failed to use webdriver-manager: {e}")
         driver = webdriver.Chrome(options=options)
     
+    # The content-setting prefs do not stop font files, preloaded images or
+    # tracking beacons; block those for the tab every scrape navigates in
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+    
     return driver
 
+# Long-lived Chrome driver shared by every scrape endpoint. Flask serves
+# requests on several threads, so all access goes through _driver_lock.
+_shared_driver = None
+_driver_lock = threading.Lock()
+
+def get_shared_driver():
+    """Return the shared headless driver, starting Chrome on first use.
+
+    Callers must hold _driver_lock.
+    """
+    global _shared_driver
+    if _shared_driver is None:
+        _shared_driver = setup_driver(headless=True)  # Use headless for production
+    return _shared_driver
+
+def reset_shared_driver():
+    """Quit the shared driver so the next scrape starts a fresh Chrome."""
+    global _shared_driver
+    if _shared_driver is not None:
+        try:
+            _shared_driver.quit()
+        except Exception as e:
+            logger.warning(f"Error quitting shared driver: {e}")
+        _shared_driver = None
+
+def release_shared_driver():
+    """Clear the shared driver's cookies and release _driver_lock.
+
+    Cookies from one scrape would otherwise carry into the next URL. A driver
+    that can no longer be reached is reset instead.
+    """
+    try:
+        if _shared_driver is not None:
+            try:
+                _shared_driver.delete_all_cookies()
+            except WebDriverException as e:
+                logger.warning(f"Could not clear driver cookies, recreating driver: {e}")
+                reset_shared_driver()
+    finally:
+        _driver_lock.release()
+
+atexit.register(reset_shared_driver)
+
+# Odds move on the order of minutes, so repeat scrapes of the same URL are
+# served from memory instead of driving Chrome again.
+SCRAPE_CACHE_TTL = 60
+_scrape_cache = TTLCache(maxsize=64, ttl=SCRAPE_CACHE_TTL)
+_scrape_cache_lock = threading.Lock()
+
+def _has_scraped_teams(result):
+    """Return True if a scrape result holds at least one team."""
+    if isinstance(result, dict):
+        return result.get("validation", {}).get("total_teams", 0) > 0
+    return bool(result)
+
+def cache_scrape_results(func):
+    """Cache non-empty scrape results per call arguments for SCRAPE_CACHE_TTL seconds."""
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = (func.__name__,) + tuple(bound.arguments.values())
+        
+        with _scrape_cache_lock:
+            cached = _scrape_cache.get(key)
+        if cached is not None:
+            logger.info(f"Serving cached {func.__name__} result for {bound.arguments}")
+            return copy.deepcopy(cached)
+        
+        result = func(*args, **kwargs)
+        # Failed scrapes return an empty list, or a conference/division dict
+        # with no teams; never cache those
+        if _has_scraped_teams(result):
+            with _scrape_cache_lock:
+                _scrape_cache[key] = copy.deepcopy(result)
+        return result
+    
+    return wrapper
+
+# Conference and division boards are read in the browser, so their pages are
+# never serialized to HTML and re-parsed. Championship and betting-line pages
+# fall back to heuristics written against BeautifulSoup, so they keep a soup.
+TEAM_TITLE_CSS = 'span[data-testid="button-title-market-board"]'
+TEAM_ODDS_CSS = 'span[data-testid="button-odds-market-board"]'
+DIVISION_TITLE_CSS = 'div.cb-title__simple-title.cb-title__nav-title'
+MARKET_BOARD_CSS = f'{TEAM_TITLE_CSS}, {TEAM_ODDS_CSS}'
+# Indexes into DIVISION_BOARD_SELECTORS, as reported by extract_ordered_texts
+DIVISION_BOARD_SELECTORS = (DIVISION_TITLE_CSS, TEAM_TITLE_CSS, TEAM_ODDS_CSS)
+DIVISION_TITLE, TEAM_TITLE, TEAM_ODDS = range(3)
+
+MARKET_BOARD_SELECTOR = soupsieve.compile(MARKET_BOARD_CSS)
+# Championship boundaries only count headers whose class is exactly this pair,
+# as find_all(class_="...") did before the selector was compiled
+TOURNAMENT_HEADER_SELECTOR = soupsieve.compile('div[class="cb-title__simple-title cb-title__nav-title"]')
+# Stripped text of a tag, without re-binding get_text for every span
+span_text = methodcaller("get_text", strip=True)
+
+def find_market_board_spans(tag):
+    """Return (team title spans, odds spans) under `tag`, found in one tree walk."""
+    team_spans, odds_spans = [], []
+    for span in MARKET_BOARD_SELECTOR.select(tag):
+        if span["data-testid"] == "button-title-market-board":
+            team_spans.append(span)
+        else:
+            odds_spans.append(span)
+    return team_spans, odds_spans
+
+@cache_scrape_results
 def scrape_draftkings_odds(url, event_type="championship"):
     """Improved DraftKings odds scraper with support for championship, conference, and division events."""
-    driver = setup_driver(headless=True)  # Use headless for production
+    _driver_lock.acquire()
     try:
+        driver = get_shared_driver()
         logger.info(f"Scraping URL: {url} with event_type: {event_type}")
         driver.get(url)
         
@@ -599,26 +755,34 @@ def scrape_draftkings_odds(url, event_type="championship"):
             logger.warning("No elements found with any selector")
             return []
         
-        # Wait a bit more for dynamic content
-        time.sleep(random.uniform(2, 4))
-        
-        # Parse the HTML
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
+        # Wait until enough odds rows have rendered rather than sleeping blindly
+        try:
+            WebDriverWait(driver, 15).until(
+                lambda d: len(d.find_elements(By.CSS_SELECTOR, 'span[data-testid="button-odds-market-board"]')) >= 4
+            )
+        except TimeoutException:
+            logger.warning("Fewer than 4 odds elements rendered, parsing what is available")
         
         # Route to appropriate scraper based on event type
         if event_type == "conference":
-            return scrape_conference_odds(soup)
+            return scrape_conference_odds(*extract_texts(driver, TEAM_TITLE_CSS, TEAM_ODDS_CSS))
         elif event_type == "division":
-            return scrape_division_odds(soup)
+            return scrape_division_odds(extract_ordered_texts(driver, *DIVISION_BOARD_SELECTORS))
         else:  # championship or unknown
-            return scrape_championship_odds(soup)
+            return scrape_championship_odds(BeautifulSoup(driver.page_source, 'lxml'))
+    
+    except WebDriverException as e:
+        # The browser session died; drop it so the next request gets a new one
+        logger.error(f"WebDriver error, recreating driver: {e}")
+        reset_shared_driver()
+        return []
     
     except Exception as e:
         logger.error(f"Scraping error: {e}")
         return []
     
     finally:
-        driver.quit()
+        release_shared_driver()
 
 def scrape_first_tournament_only(soup, tournament_type):
     """Scrape only the first tournament on the page, limiting to first N entries to avoid cross-tournament contamination."""
@@ -718,8 +882,8 @@ def scrape_first_tournament_only(soup, tournament_type):
         team_span = team_elements[i]
         odds_span = odds_elements[i]
         
-        team_name = clean_team_name(team_span.get_text(strip=True))
-        original_odds = odds_span.get_text(strip=True)
+        team_name = clean_team_name(span_text(team_span))
+        original_odds = span_text(odds_span)
         processed_odds = process_odds(original_odds)
         
         # Additional check: if we encounter a team name that suggests we're in a different tournament
@@ -830,10 +994,12 @@ def filter_odds_by_betting_line(odds_data, line_name, tournament_type):
     return filtered_data
 
 
+@cache_scrape_results
 def scrape_multi_line_tournament(url):
     """Scrape tournament with multiple betting lines (Golf, Auto Racing) and create separate tournaments for each line."""
-    driver = setup_driver(headless=True)  # Use headless for better performance
+    _driver_lock.acquire()
     try:
+        driver = get_shared_driver()
         logger.info(f"Scraping multi-line tournament: {url}")
         driver.get(url)
         
@@ -863,11 +1029,16 @@ def scrape_multi_line_tournament(url):
             logger.warning("No elements found with any selector")
             return []
         
-        # Wait a bit more for dynamic content
-        time.sleep(random.uniform(2, 4))
+        # Wait until enough odds rows have rendered rather than sleeping blindly
+        try:
+            WebDriverWait(driver, 15).until(
+                lambda d: len(d.find_elements(By.CSS_SELECTOR, 'span[data-testid="button-odds-market-board"]')) >= 4
+            )
+        except TimeoutException:
+            logger.warning("Fewer than 4 odds elements rendered, parsing what is available")
         
         # Parse the HTML to detect tournament type and betting lines
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
+        soup = BeautifulSoup(driver.page_source, 'lxml')
         
         # Detect tournament type
         tournament_type = detect_tournament_type(url)
@@ -952,12 +1123,46 @@ def scrape_multi_line_tournament(url):
         logger.info(f"Successfully created {len(tournaments)} tournaments")
         return tournaments
     
+    except WebDriverException as e:
+        # The browser session died; drop it so the next request gets a new one
+        logger.error(f"WebDriver error, recreating driver: {e}")
+        reset_shared_driver()
+        return []
+    
     except Exception as e:
         logger.error(f"Multi-line scraping error: {e}")
         return []
     
     finally:
-        driver.quit()
+        release_shared_driver()
+
+# Collects the trimmed text of every element matching each selector in a single
+# WebDriver round-trip, instead of one round-trip per element
+_EXTRACT_TEXTS_JS = """
+return arguments[0].map(function (selector) {
+    return Array.from(document.querySelectorAll(selector), function (el) {
+        return el.textContent.trim();
+    });
+});
+"""
+
+def extract_texts(driver, *selectors):
+    """Return, for each CSS selector, the text of all matching elements in the live page."""
+    return driver.execute_script(_EXTRACT_TEXTS_JS, list(selectors))
+
+# Like _EXTRACT_TEXTS_JS, but one document-order list over all the selectors,
+# for boards where headers and rows interleave
+_EXTRACT_ORDERED_TEXTS_JS = """
+const selectors = arguments[0];
+return Array.from(document.querySelectorAll(selectors.join(", ")), function (el) {
+    const index = selectors.findIndex(function (selector) { return el.matches(selector); });
+    return [index, el.textContent.trim()];
+});
+"""
+
+def extract_ordered_texts(driver, *selectors):
+    """Return [selector index, text] for every element matching any selector, in document order."""
+    return driver.execute_script(_EXTRACT_ORDERED_TEXTS_JS, list(selectors))
 
 def scrape_betting_line_with_interaction(driver, line_name, tournament_type):
     """Scrape data for a specific betting line by interacting with the page."""
@@ -1012,21 +1217,20 @@ def scrape_betting_line_with_interaction(driver, line_name, tournament_type):
         # Wait for the page to update after clicking
         time.sleep(random.uniform(2, 4))
         
-        # Parse the updated HTML
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-        
-        # Look for team/player names and odds
-        team_elements = soup.find_all("span", {"data-testid": "button-title-market-board"})
-        odds_elements = soup.find_all("span", {"data-testid": "button-odds-market-board"})
+        # Read team/player names and odds straight from the updated page
+        team_texts, odds_texts = extract_texts(
+            driver,
+            'span[data-testid="button-title-market-board"]',
+            'span[data-testid="button-odds-market-board"]',
+        )
         
-        if team_elements and odds_elements:
-            logger.info(f"Found {len(team_elements)} teams and {len(odds_elements)} odds for {line_name}")
+        if team_texts and odds_texts:
+            logger.info(f"Found {len(team_texts)} teams and {len(odds_texts)} odds for {line_name}")
             
-            # Create teams list with bounds checking
+            # Pair names with odds; zip stops at the shorter list
             teams = [
-                {"team": clean_team_name(team_span.get_text(strip=True)), "odds": odds_elements[i].get_text(strip=True)}
-                for i, team_span in enumerate(team_elements)
-                if i < len(odds_elements)
+                {"team": clean_team_name(team_text), "odds": odds_text}
+                for team_text, odds_text in zip(team_texts, odds_texts)
             ]
             
             # Process odds for all teams
@@ -1110,27 +1314,23 @@ def scrape_betting_line_data(soup, line_name, tournament_type):
         if target_container:
             logger.info(f"Using parent container for {line_name}")
             # Search within the specific container
-            team_elements = target_container.find_all("span", {"data-testid": "button-title-market-board"})
-            odds_elements = target_container.find_all("span", {"data-testid": "button-odds-market-board"})
+            team_elements, odds_elements = find_market_board_spans(target_container)
         else:
             logger.info(f"No specific container found for {line_name}, using page-wide search")
             # Fallback to page-wide search
-            team_elements = soup.find_all("span", {"data-testid": "button-title-market-board"})
-            odds_elements = soup.find_all("span", {"data-testid": "button-odds-market-board"})
+            team_elements, odds_elements = find_market_board_spans(soup)
     else:
         logger.warning(f"Could not find betting line element for: {line_name}")
         # Fallback to page-wide search
-        team_elements = soup.find_all("span", {"data-testid": "button-title-market-board"})
-        odds_elements = soup.find_all("span", {"data-testid": "button-odds-market-board"})
+        team_elements, odds_elements = find_market_board_spans(soup)
     
     if team_elements and odds_elements:
         logger.info(f"Found {len(team_elements)} teams and {len(odds_elements)} odds for {line_name}")
         
-        # Create teams list with bounds checking
+        # Pair names with odds; zip stops at the shorter list
         teams = [
-            {"team": clean_team_name(team_span.get_text(strip=True)), "odds": odds_elements[i].get_text(strip=True)}
-            for i, team_span in enumerate(team_elements)
-            if i < len(odds_elements)
+            {"team": clean_team_name(span_text(team_span)), "odds": span_text(odds_span)}
+            for team_span, odds_span in zip(team_elements, odds_elements)
         ]
         
         # Process odds for all teams
@@ -1152,7 +1352,7 @@ def scrape_championship_odds(soup):
     seen_teams = set()  # Track teams to prevent duplicates
     
     # Find tournament headers to detect boundaries
-    tournament_headers = soup.find_all("div", class_="cb-title__simple-title cb-title__nav-title")
+    tournament_headers = TOURNAMENT_HEADER_SELECTOR.select(soup)
     logger.info(f"Found {len(tournament_headers)} tournament headers on page")
     
     # Log all tournament headers for debugging
@@ -1161,8 +1361,7 @@ def scrape_championship_odds(soup):
         logger.info(f"Tournament header {i+1}: '{header_text}'")
     
     # Method 1: Try the working selectors from V1
-    team_elements = soup.find_all("span", {"data-testid": "button-title-market-board"})
-    odds_elements = soup.find_all("span", {"data-testid": "button-odds-market-board"})
+    team_elements, odds_elements = find_market_board_spans(soup)
     
     # If V1 selectors don't work, try regex patterns as fallback
     if not team_elements or not odds_elements:
@@ -1207,8 +1406,8 @@ def scrape_championship_odds(soup):
         logger.info(f"Scraping {max_entries} entries from tournament {target_tournament_index + 1}")
         
         for i, (team, odd) in enumerate(zip(team_elements[:max_entries], odds_elements[:max_entries])):
-            team_name = clean_team_name(team.get_text(strip=True))
-            original_odds = odd.get_text(strip=True)
+            team_name = clean_team_name(span_text(team))
+            original_odds = span_text(odd)
             processed_odds = process_odds(original_odds)
             
             # Normalize the driver name to handle variations
@@ -1583,17 +1782,13 @@ def scrape_championship_odds_regex_fallback(soup):
     logger.info(f"Regex fallback found {len(odds_data)} entries")
     return odds_data
 
-def scrape_conference_odds(soup):
-    """Scrape conference odds with teams grouped by conference (from V1 logic)."""
-    team_spans = soup.find_all("span", {"data-testid": "button-title-market-board"})
-    odds_spans = soup.find_all("span", {"data-testid": "button-odds-market-board"})
-    
-    # Create teams list with bounds checking
-    teams = [
-        {"team": team_span.get_text(strip=True), "odds": odds_spans[i].get_text(strip=True)}
-        for i, team_span in enumerate(team_spans)
-        if i < len(odds_spans)
-    ]
+def scrape_conference_odds(team_texts, odds_texts):
+    """Scrape conference odds with teams grouped by conference (from V1 logic).
+    
+    Takes the page's team title and odds texts, in page order.
+    """
+    # Pair names with odds; zip stops at the shorter list
+    teams = [{"team": team, "odds": odds} for team, odds in zip(team_texts, odds_texts)]
     
     # Process odds for all teams
     for team in teams:
@@ -1623,49 +1818,57 @@ def scrape_conference_odds(soup):
         }
     }
 
-def scrape_division_odds(soup):
-    """Scrape division odds with teams grouped by division (from V1 logic)."""
-    division_titles = soup.find_all("div", class_="cb-title__simple-title cb-title__nav-title")
-    team_spans = soup.find_all("span", {"data-testid": "button-title-market-board"})
-    odds_spans = soup.find_all("span", {"data-testid": "button-odds-market-board"})
-    
-    # Create teams list with bounds checking
-    teams = [
-        {"team": clean_team_name(team_span.get_text(strip=True)), "odds": odds_spans[i].get_text(strip=True)}
-        for i, team_span in enumerate(team_spans)
-        if i < len(odds_spans)
-    ]
-    
-    # Process odds for all teams
-    for team in teams:
-        team["processed_odds"] = process_odds(team["odds"])
-        team["original_odds"] = team["odds"]
-        team["odds"] = team["processed_odds"]
+@functools.lru_cache(maxsize=64)
+def parse_division_title(division_text):
+    """Split a header like "NFL 2025/26 - NFC East" into ("NFC", "East"); memoized."""
+    full_division = division_text.rpartition(" - ")[2]  # Extract "NFC East" from full title
+    conference, _, division = full_division.partition(" ")
+    division = division.strip()
+    if not division:
+        return full_division, "Unknown"
+    return conference, division
+
+def scrape_division_odds(board):
+    """Scrape division odds with teams grouped by division (from V1 logic).
     
-    # Extract division names and create divisions
+    `board` lists the page's division headers, team titles and odds as
+    [DIVISION_TITLE/TEAM_TITLE/TEAM_ODDS, text] pairs in document order, so
+    each team is assigned to the division header that precedes it.
+    """
     divisions = []
-    teams_per_division = len(teams) // len(division_titles) if division_titles else 0
-    
-    for i, title in enumerate(division_titles):
-        division_text = title.get_text(strip=True)
-        full_division = division_text.split(" - ")[-1]  # Extract "NFC East" from full title
-        
-        # Parse conference and division
-        parts = full_division.split()
-        conference = parts[0] if len(parts) >= 2 else full_division
-        division = " ".join(parts[1:]) if len(parts) >= 2 else "Unknown"
-        
-        # Get teams for this division
-        start_idx = i * teams_per_division
-        end_idx = start_idx + teams_per_division if i < len(division_titles) - 1 else len(teams)
-        
-        division_teams = teams[start_idx:end_idx]
-        if division_teams:
+    # Teams listed before the first header belong to the first division
+    current_teams = []
+    pending_team = None
+    teams = []
+    
+    for kind, text in board:
+        if kind == DIVISION_TITLE:
+            conference, division = parse_division_title(text)
+            
+            if divisions:
+                current_teams = []
             divisions.append({
                 "division": division,
                 "conference": conference,
-                "teams": division_teams
+                "teams": current_teams
             })
+            pending_team = None
+        elif kind == TEAM_TITLE:
+            pending_team = clean_team_name(text)
+        elif pending_team is not None:
+            original_odds = text
+            processed_odds = process_odds(original_odds)
+            team = {
+                "team": pending_team,
+                "odds": processed_odds,
+                "processed_odds": processed_odds,
+                "original_odds": original_odds
+            }
+            current_teams.append(team)
+            teams.append(team)
+            pending_team = None
+    
+    divisions = [division for division in divisions if division["teams"]]
     
     logger.info(f"Division scraping: {len(divisions)} divisions, {len(teams)} total teams")
     
@@ -2087,7 +2290,7 @@ def submit_multi_line_tournaments():
                 logger.info(f"Creating game for {line_name}")
                 
                 api_url = "https://clmapi.sportsfanwagers.com/api/Game/InsertGame"
-                response = requests.post(api_url, json=game_payload, timeout=60)
+                response = _clm_session.post(api_url, json=game_payload, timeout=60)
                 
                 if response.status_code == 200:
                     result = response.json()
@@ -2104,7 +2307,7 @@ def submit_multi_line_tournaments():
                     logger.info(f"Submitting odds for {line_name}")
                     
                     odds_api_url = f"https://clmapi.sportsfanwagers.com/api/Game/InsertGameValuesTNT?idGame={game_id}"
-                    odds_response = requests.post(odds_api_url, json=odds_payload, timeout=60)
+                    odds_response = _clm_session.post(odds_api_url, json=odds_payload, timeout=60)
                     
                     if odds_response.status_code == 200:
                         odds_result = odds_response.json()
@@ -2299,7 +2502,7 @@ def submit_all_individual_tournaments():
                 logger.info(f"Creating individual tournament: {individual_tournament_name}")
                 
                 api_url = "https://clmapi.sportsfanwagers.com/api/Game/InsertGame"
-                response = requests.post(api_url, json=game_payload, timeout=60)
+                response = _clm_session.post(api_url, json=game_payload, timeout=60)
                 
                 if response.status_code == 200:
                     result = response.json()
@@ -2316,7 +2519,7 @@ def submit_all_individual_tournaments():
                     logger.info(f"Submitting odds for {individual_tournament_name}")
                     
                     odds_api_url = f"https://clmapi.sportsfanwagers.com/api/Game/InsertGameValuesTNT?idGame={game_id}"
-                    odds_response = requests.post(odds_api_url, json=game_values, timeout=60)
+                    odds_response = _clm_session.post(odds_api_url, json=game_values, timeout=60)
                     
                     if odds_response.status_code == 200:
                         odds_result = odds_response.json()
@@ -2402,7 +2605,7 @@ def submit_game():
         # Submit to CLM API
         api_url = "https://clmapi.sportsfanwagers.com/api/Game/InsertGame"
         
-        response = requests.post(api_url, json=game_payload, timeout=60)
+        response = _clm_session.post(api_url, json=game_payload, timeout=60)
         
         if response.status_code == 200:
             result = response.json()
@@ -2455,7 +2658,7 @@ def submit_odds():
         # Submit to CLM API
         api_url = f"https://clmapi.sportsfanwagers.com/api/Game/InsertGameValuesTNT?idGame={game_id}"
         
-        response = requests.post(api_url, json=odds_payload, timeout=60)
+        response = _clm_session.post(api_url, json=odds_payload, timeout=60)
         
         if response.status_code == 200:
             result = response.json()
@@ -2500,7 +2703,7 @@ def submit_complete():
         logger.info("Submitting game creation to CLM API")
         
         api_url = "https://clmapi.sportsfanwagers.com/api/Game/InsertGame"
-        response = requests.post(api_url, json=game_payload, timeout=60)
+        response = _clm_session.post(api_url, json=game_payload, timeout=60)
         
         if response.status_code == 200:
             result = response.json()
@@ -2517,7 +2720,7 @@ def submit_complete():
             logger.info(f"Submitting odds for game ID: {game_id}")
             
             odds_api_url = f"https://clmapi.sportsfanwagers.com/api/Game/InsertGameValuesTNT?idGame={game_id}"
-            odds_response = requests.post(odds_api_url, json=odds_payload, timeout=60)
+            odds_response = _clm_session.post(odds_api_url, json=odds_payload, timeout=60)
             
             if odds_response.status_code == 200:
                 odds_result = odds_response.json()
@@ -2578,7 +2781,7 @@ def check_existing_odds():
         # Check existing odds
         api_url = f"https://clmapi.sportsfanwagers.com/api/Game/GetGameValuesTNT?idGame={game_id}"
         
-        response = requests.get(api_url, timeout=10)
+        response = _clm_session.get(api_url, timeout=10)
         
         if response.status_code == 200:
             existing_odds = response.json()
@@ -2606,6 +2809,26 @@ def check_existing_odds():
             'error': str(e)
         }), 500
 
+@app.route('/api/cache/refresh', methods=['POST'])
+def refresh_scrape_cache():
+    """Evict cached scrape results so the next request scrapes again."""
+    data = request.get_json(silent=True) or {}
+    url = data.get('url')
+    
+    with _scrape_cache_lock:
+        if url:
+            keys = [key for key in _scrape_cache.keys() if key[1] == url]
+        else:
+            keys = list(_scrape_cache.keys())
+        for key in keys:
+            _scrape_cache.pop(key, None)
+    
+    logger.info(f"Evicted {len(keys)} cached scrape results")
+    return jsonify({
+        'success': True,
+        'evicted': len(keys)
+    })
+
 @app.route('/api/status')
 def status():
     """API endpoint to check server status."""